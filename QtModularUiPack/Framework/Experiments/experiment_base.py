@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from QtModularUiPack.Framework import is_non_strict_type
+from QtModularUiPack.Framework import is_non_strict_subclass
 from PyQt5.QtCore import QMetaObject, Q_ARG
 from time import sleep
 import h5py
@@ -93,9 +93,8 @@ class BaseExperiment(object):
         if self.required_tools is not None:
             for tool_type in self.required_tools:
                 found = False
-                for member in self.tools.__dict__:
-                    tool = self.tools.__dict__[member]
-                    if is_non_strict_type(type(tool), tool_type):
+                for tool in self.tools.__dict__.values():
+                    if is_non_strict_subclass(type(tool), tool_type):  # derived tools fulfill the requirement as well
                         found = True
                         break
                 if not found:
@@ -3,3 +3,6 @@ from QtModularUiPack.Framework.Extensions.observable_list import ObservableList
 from QtModularUiPack.Framework.Extensions.singleton import Singleton
 from QtModularUiPack.Framework.Extensions.code_environment import CodeEnvironment
 from QtModularUiPack.Framework.Extensions.killable_thread import KillableThread
+from QtModularUiPack.Framework.Extensions.gui_dispatcher import GuiDispatcher
+from QtModularUiPack.Framework.Extensions.async_signal import AsyncSignal, AsyncEmission, AsyncEventLoop
+from QtModularUiPack.Framework.Extensions.instrumentation import Instrumentation
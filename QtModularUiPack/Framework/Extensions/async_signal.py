@@ -0,0 +1,223 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.Extensions.singleton import Singleton
+from QtModularUiPack.Framework.Extensions.signal import Signal
+from QtModularUiPack.Framework.Extensions.gui_dispatcher import GuiDispatcher
+from concurrent.futures import Future
+from threading import Thread, Lock
+from inspect import isawaitable
+import asyncio
+import traceback
+
+
+@Singleton
+class AsyncEventLoop(object):
+    """
+    Provides the asyncio event loop on which coroutine handlers of asynchronous signals are executed.
+    By default a loop is run in a background thread. Applications which already integrate asyncio with the Qt event
+    loop (e.g. through qasync) can hand over their loop with set_loop().
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = Lock()
+
+    @property
+    def loop(self):
+        """
+        Gets the event loop (the background loop is started on first use)
+        """
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    self._start_()
+        return self._loop
+
+    def set_loop(self, loop):
+        """
+        Use an existing event loop for the coroutine handlers (must be running while signals are emitted)
+        :param loop: asyncio event loop
+        """
+        self._loop = loop
+
+    def submit(self, coroutine):
+        """
+        Schedule a coroutine on the event loop
+        :param coroutine: coroutine to run
+        :return: concurrent.futures.Future of the result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def _start_(self):
+        """
+        Start the background event loop thread
+        """
+        loop = asyncio.new_event_loop()
+        self._thread = Thread(target=loop.run_forever, name='AsyncEventLoop', daemon=True)
+        self._thread.start()
+        self._loop = loop
+
+
+class AsyncEmission(object):
+    """
+    Result of an asynchronous emit. It can be awaited (from any running event loop), waited for, cancelled or observed
+    with a callback on the GUI thread.
+    The result is a list with one entry per handler in order of connection. Handlers which failed or timed out have their
+    exception as result.
+    """
+
+    def __init__(self, future):
+        self._future = future
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
+
+    def done(self):
+        """
+        Returns true if all handlers have finished (or the emission was cancelled)
+        """
+        return self._future.done()
+
+    def cancelled(self):
+        """
+        Returns true if the emission was cancelled
+        """
+        return self._future.cancelled()
+
+    def cancel(self):
+        """
+        Cancel all handlers which are still running
+        :return: True if the emission was cancelled
+        """
+        return self._future.cancel()
+
+    def result(self, timeout=None):
+        """
+        Block until all handlers have finished (do not call this on the thread running the event loop)
+        :param timeout: (Optional) maximum time to wait in seconds
+        :return: list of handler results
+        """
+        return self._future.result(timeout)
+
+    def add_done_callback(self, callback, gui_thread=True):
+        """
+        Call a function with the list of results once all handlers have finished (not called if cancelled)
+        :param callback: function taking the list of results
+        :param gui_thread: if true the callback is executed on the Qt GUI thread
+        """
+        def done(future):
+            if future.cancelled():
+                return
+            if gui_thread:
+                GuiDispatcher.instance.post(callback, future.result())
+            else:
+                callback(future.result())
+        self._future.add_done_callback(done)
+
+
+async def _gather_(results, pending, timeout):
+    """
+    Wait for the coroutine handlers concurrently and insert their results
+    :param results: list of results (awaited entries are replaced)
+    :param pending: list of (index, awaitable) tuples
+    :param timeout: (Optional) timeout per handler in seconds
+    :return: list of results
+    """
+    if timeout is None:
+        awaitables = [awaitable for index, awaitable in pending]
+    else:
+        awaitables = [asyncio.wait_for(awaitable, timeout) for index, awaitable in pending]
+    values = await asyncio.gather(*awaitables, return_exceptions=True)     # a failing handler does not stop the others
+    for (index, awaitable), value in zip(pending, values):
+        results[index] = value
+    return results
+
+
+def _report_errors_(results):
+    """
+    Print the errors of handlers of a fire-and-forget emit
+    :param results: list of results
+    """
+    for result in results:
+        if isinstance(result, Exception):   # cancelled handlers are no errors (CancelledError is no Exception)
+            traceback.print_exception(type(result), result, result.__traceback__)
+            print('Error in asynchronous signal handler, Error: {}'.format(result))
+
+
+class AsyncSignal(Signal):
+    """
+    A signal whose handlers can be coroutine functions.
+    Plain handlers are called on the emitting thread. Coroutine handlers are executed concurrently on an asyncio event
+    loop, which is the loop running in the emitting thread or otherwise the loop of AsyncEventLoop.
+    Coroutine handlers do not run on the GUI thread, UI updates have to be posted through a queued connection or the
+    GuiDispatcher.
+
+    Example:
+        signal = AsyncSignal(float)
+        signal.connect(instrument.move_to)  # async def move_to(self, position)
+        results = await signal.emit_async(1.5, timeout=10)
+    """
+
+    def emit_async(self, *args, timeout=None):
+        """
+        Emit signal and run the coroutine handlers concurrently
+        :param args: arguments
+        :param timeout: (Optional) time in seconds after which a coroutine handler is cancelled (its result is a TimeoutError)
+        :return: AsyncEmission of the results
+        """
+        if Signal._validation_enabled:
+            self._validate(args)
+
+        results = list()
+        pending = list()
+        snapshot = self._snapshot or self._get_snapshot_()
+        callbacks = self._callbacks
+        for key, reference, function in snapshot:
+            if self._snapshot is not snapshot and key not in callbacks:
+                continue    # disconnected by a previous callback of this emit
+            if reference is None:
+                result = function(*args)
+            else:
+                instance = reference()
+                if instance is None:
+                    continue
+                result = function(instance, *args)
+            if isawaitable(result):
+                pending.append((len(results), result))
+            results.append(result)
+
+        if not pending:     # only plain handlers -> nothing to schedule
+            future = Future()
+            future.set_result(results)
+            return AsyncEmission(future)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = AsyncEventLoop.instance.loop
+        return AsyncEmission(asyncio.run_coroutine_threadsafe(_gather_(results, pending, timeout), loop))
+
+    def emit(self, *args):
+        """
+        Emit signal without waiting for the coroutine handlers (their errors are printed)
+        :param args: arguments
+        :return: AsyncEmission of the results
+        """
+        emission = self.emit_async(*args)
+        emission.add_done_callback(_report_errors_, gui_thread=False)
+        return emission
@@ -0,0 +1,124 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.Extensions.singleton import Singleton
+from PyQt5.QtCore import QObject, QThread, QCoreApplication, pyqtSignal, pyqtSlot
+from collections import deque
+from threading import Lock, get_ident
+import traceback
+
+
+class _DispatchInvoker(QObject):
+    """
+    Helper object living in the GUI thread. Emitting the wakeup signal from any thread runs the drain on the GUI thread.
+    """
+
+    wakeup = pyqtSignal()
+
+    def __init__(self, drain):
+        super().__init__()
+        self._drain = drain
+        self.wakeup.connect(self.on_wakeup)
+
+    @pyqtSlot()
+    def on_wakeup(self):
+        self._drain()
+
+
+@Singleton
+class GuiDispatcher(object):
+    """
+    Runs callbacks posted from any thread on the Qt GUI thread.
+    Posted calls are collected in a queue and executed in batches (one event loop wakeup per batch).
+    Calls that are posted with the same key while still waiting are only executed once.
+    """
+
+    def __init__(self):
+        self._queue = deque()   # appending is atomic -> producers do not need to take the lock
+        self._lock = Lock()     # only guards the wakeup flag and the creation of the invoker
+        self._wakeup_pending = False
+        self._invoker = None
+        self._gui_thread_ident = None
+
+    def is_gui_thread(self):
+        """
+        Returns true if the calling thread is the Qt GUI thread (or if there is no Qt application)
+        """
+        if self._gui_thread_ident is not None:
+            return get_ident() == self._gui_thread_ident
+
+        app = QCoreApplication.instance()
+        if app is None:
+            return True     # without an application there is no GUI thread to marshal to
+        if QThread.currentThread() == app.thread():
+            self._gui_thread_ident = get_ident()    # remember the GUI thread for fast checks
+            return True
+        return False
+
+    def post(self, callback, *args, key=None):
+        """
+        Execute a callback on the GUI thread
+        :param callback: function to call
+        :param args: arguments of the call
+        :param key: (Optional) calls with equal keys which are waiting at the same time are merged into one call
+        """
+        if QCoreApplication.instance() is None:     # no event loop -> call directly
+            callback(*args)
+            return
+
+        self._queue.append((key, callback, args))
+        if not self._wakeup_pending:
+            with self._lock:
+                if self._invoker is None:
+                    self._create_invoker_()
+                if self._wakeup_pending:
+                    return
+                self._wakeup_pending = True
+            self._invoker.wakeup.emit()
+
+    def _create_invoker_(self):
+        """
+        Create the invoker object and move it to the GUI thread
+        """
+        invoker = _DispatchInvoker(self._drain_)
+        app_thread = QCoreApplication.instance().thread()
+        if invoker.thread() != app_thread:
+            invoker.moveToThread(app_thread)
+        self._invoker = invoker
+
+    def _drain_(self):
+        """
+        Execute all waiting calls (runs on the GUI thread)
+        """
+        self._gui_thread_ident = get_ident()
+        with self._lock:
+            self._wakeup_pending = False    # calls posted from now on need a new wakeup
+
+        calls = dict()
+        queue = self._queue
+        for i in range(len(queue)):
+            key, callback, args = queue.popleft()
+            if key is None:
+                key = object()  # calls without a key are never merged
+            if key not in calls:
+                calls[key] = (callback, args)
+
+        for callback, args in calls.values():
+            try:
+                callback(*args)
+            except Exception as e:  # one failing call must not prevent the others from running
+                traceback.print_exc()
+                print('Error during dispatch to the GUI thread, Error: {}'.format(e))
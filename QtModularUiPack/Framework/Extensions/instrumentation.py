@@ -0,0 +1,198 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.Extensions.singleton import Singleton
+from threading import Lock
+
+
+HISTOGRAM_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1)  # upper bounds of the duration histogram bins in seconds (last bin is open)
+HISTOGRAM_LABELS = ('<10us', '<100us', '<1ms', '<10ms', '<100ms', '>=100ms')
+
+
+def _format_duration(seconds):
+    """
+    Format a duration for reports
+    :param seconds: duration in seconds
+    :return: text
+    """
+    if seconds < 1e-3:
+        return '{:.1f}us'.format(seconds * 1e6)
+    return '{:.2f}ms'.format(seconds * 1e3)
+
+
+class Statistics(object):
+    """
+    Recorded timings of one signal, binding or view model
+    """
+
+    def __init__(self, category, name):
+        self.category = category
+        self.name = name
+        self.count = 0  # number of events (emits, widget updates, notifications)
+        self.total_time = 0.0   # time spent in the handlers in seconds
+        self.max_time = 0.0     # longest single handler call in seconds
+        self.histogram = [0] * len(HISTOGRAM_LABELS)    # number of handler calls per duration bin
+        self.handlers = dict()  # handler name -> [calls, total time, max time]
+
+    @property
+    def mean_time(self):
+        """
+        Gets the mean time per event in seconds
+        """
+        return self.total_time / self.count if self.count > 0 else 0.0
+
+    @property
+    def slowest_handler(self):
+        """
+        Gets the name of the handler with the longest single call (or None)
+        """
+        if not self.handlers:
+            return None
+        return max(self.handlers.items(), key=lambda item: item[1][2])[0]
+
+    def add(self, duration, handler=None):
+        """
+        Record the duration of one handler call
+        :param duration: duration in seconds
+        :param handler: (Optional) name of the handler
+        """
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        index = 0
+        for bound in HISTOGRAM_BOUNDS:
+            if duration < bound:
+                break
+            index += 1
+        self.histogram[index] += 1
+        if handler is not None:
+            entry = self.handlers.get(handler)
+            if entry is None:
+                self.handlers[handler] = [1, duration, duration]
+            else:
+                entry[0] += 1
+                entry[1] += duration
+                if duration > entry[2]:
+                    entry[2] = duration
+
+
+@Singleton
+class Instrumentation(object):
+    """
+    Opt-in recording of the time spent in signal handlers, bindings and change notifications of view models.
+    While disabled the instrumented code paths are not used at all (or cost a single flag check).
+
+    Example:
+        Instrumentation.instance.enabled = True
+        ...
+        print(Instrumentation.instance.report(top=10))
+    """
+
+    @property
+    def enabled(self):
+        """
+        Gets whether timings are recorded
+        """
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        """
+        Sets whether timings are recorded
+        :param value: True or False
+        """
+        self._enabled = bool(value)
+        for switch in self._switches:   # let the instrumented classes exchange their code paths
+            switch(self._enabled)
+
+    def __init__(self):
+        self._enabled = False
+        self._switches = list()
+        self._statistics = dict()   # (category, name) -> statistics
+        self._lock = Lock()
+
+    def add_switch(self, switch):
+        """
+        Register a function which is called with the new state whenever the instrumentation is enabled or disabled
+        :param switch: function taking True or False
+        """
+        self._switches.append(switch)
+        switch(self._enabled)
+
+    def get_statistics(self, category, name):
+        """
+        Returns the statistics of an instrumented object (created on first use)
+        :param category: category (e.g. "signal", "binding" or "view model")
+        :param name: name of the instrumented object
+        :return: statistics
+        """
+        statistics = self._statistics.get((category, name))
+        if statistics is None:
+            with self._lock:
+                statistics = self._statistics.setdefault((category, name), Statistics(category, name))
+        return statistics
+
+    def record(self, category, name, duration, handler=None):
+        """
+        Record one event which took the given time
+        :param category: category (e.g. "signal", "binding" or "view model")
+        :param name: name of the instrumented object
+        :param duration: duration in seconds
+        :param handler: (Optional) name of the handler
+        """
+        statistics = self.get_statistics(category, name)
+        statistics.count += 1
+        statistics.add(duration, handler)
+
+    def reset(self):
+        """
+        Drop all recorded timings
+        """
+        with self._lock:
+            self._statistics = dict()
+
+    def top(self, count=10, sort_by='total_time', category=None):
+        """
+        Returns the statistics with the highest values
+        :param count: maximum number of entries
+        :param sort_by: attribute to sort by ("total_time", "max_time", "mean_time" or "count")
+        :param category: (Optional) only return statistics of this category
+        :return: list of statistics
+        """
+        statistics = [s for s in list(self._statistics.values()) if category is None or s.category == category]
+        statistics.sort(key=lambda s: getattr(s, sort_by), reverse=True)
+        return statistics[:count]
+
+    def report(self, top=10, sort_by='total_time', category=None):
+        """
+        Returns a text report of the statistics with the highest values
+        :param top: maximum number of entries
+        :param sort_by: attribute to sort by ("total_time", "max_time", "mean_time" or "count")
+        :param category: (Optional) only report statistics of this category
+        :return: report text
+        """
+        lines = ['{:<10} {:>8} {:>10} {:>10} {:>10}  {}'.format('category', 'count', 'total', 'max', 'mean', 'name')]
+        for statistics in self.top(top, sort_by, category):
+            lines.append('{:<10} {:>8} {:>10} {:>10} {:>10}  {}'.format(
+                statistics.category[:10], statistics.count, _format_duration(statistics.total_time),
+                _format_duration(statistics.max_time), _format_duration(statistics.mean_time), statistics.name))
+            histogram = ' '.join('{}:{}'.format(label, n) for label, n in zip(HISTOGRAM_LABELS, statistics.histogram) if n)
+            if histogram:
+                lines.append('{:<10} {}'.format('', histogram))
+            slowest = statistics.slowest_handler
+            if slowest is not None:
+                lines.append('{:<10} slowest handler: {} ({})'.format('', slowest, _format_duration(statistics.handlers[slowest][2])))
+        return '\n'.join(lines)
@@ -15,18 +15,46 @@ limitations under the License.
 """
 
 from QtModularUiPack.Framework.Extensions import Signal
+from contextlib import contextmanager
 
 
 class ObservableList(list):
     """
     This list can send notifications about changes.
+
+    Every change is announced per item (item_added, item_removed or on_clear) and as one range event per operation
+    (items_inserted, items_removed). Changes made inside a suspend_notifications() block are announced once when the
+    block is left (items_reset only, listeners compare the content with what they know).
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.item_added = Signal(object)
-        self.item_removed = Signal(object)
-        self.on_clear = Signal()
+        self.item_added = Signal(object, name='ObservableList.item_added')
+        self.item_removed = Signal(object, name='ObservableList.item_removed')
+        self.on_clear = Signal(name='ObservableList.on_clear')
+        self.items_inserted = Signal(int, list, name='ObservableList.items_inserted')     # start index, inserted items
+        self.items_removed = Signal(int, list, name='ObservableList.items_removed')  # start index, removed items
+        self.items_reset = Signal(name='ObservableList.items_reset')     # the content changed in a way that is not described by a single range
+        self._suspended = 0     # nesting depth of suspend_notifications() blocks
+        self._snapshot = None   # content of the list when the notifications were suspended
+
+    @contextmanager
+    def suspend_notifications(self):
+        """
+        Context manager which suppresses all notifications while the list is modified.
+        When the (outermost) block is left a single items_reset notification is sent if the content changed.
+        """
+        if self._suspended == 0:
+            self._snapshot = list(self)
+        self._suspended += 1
+        try:
+            yield self
+        finally:
+            self._suspended -= 1
+            if self._suspended == 0:
+                snapshot = self._snapshot
+                self._snapshot = None
+                self._notify_reset_(snapshot)
 
     def append(self, item):
         """
@@ -34,19 +62,162 @@ class ObservableList(list):
         :param item: item to append to the list
         """
         super().append(item)
-        self.item_added.emit(item)
+        self._notify_inserted_(len(self) - 1, [item])
+
+    def extend(self, items):
+        """
+        Append all items of an iterable to the list. (Triggers one range notification)
+        :param items: items to append
+        """
+        items = list(items)
+        if not items:
+            return  # nothing inserted -> no (empty) range notification
+        start = len(self)
+        super().extend(items)
+        self._notify_inserted_(start, items)
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, factor):
+        if factor <= 0:
+            self.clear()
+        else:
+            self.extend(list(self) * (factor - 1))
+        return self
+
+    def insert(self, index, item):
+        """
+        Insert item before index. (Will also trigger notification)
+        :param index: index
+        :param item: item to insert
+        """
+        length = len(self)
+        if index < 0:
+            index = max(0, index + length)
+        index = min(index, length)
+        super().insert(index, item)
+        self._notify_inserted_(index, [item])
 
     def remove(self, item):
         """
         Remove item from the list. (Will also trigger notification)
         :param item: item to remove from the list
         """
-        super().remove(item)
-        self.item_removed.emit(item)
+        index = self.index(item)
+        super().__delitem__(index)
+        self._notify_removed_(index, [item])
+
+    def pop(self, index=-1):
+        """
+        Remove and return item at index (default last). (Will also trigger notification)
+        :param index: index
+        :return: removed item
+        """
+        if index < 0:
+            index += len(self)
+        item = super().pop(index)
+        self._notify_removed_(index, [item])
+        return item
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:   # extended slice -> the removed items are not one range
+                with self.suspend_notifications():
+                    super().__delitem__(index)
+                return
+            items = super().__getitem__(index)
+            super().__delitem__(index)
+            if items:
+                self._notify_removed_(start, items)
+        else:
+            if index < 0:
+                index += len(self)
+            item = super().__getitem__(index)
+            super().__delitem__(index)
+            self._notify_removed_(index, [item])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:   # extended slice -> the replaced items are not one range
+                with self.suspend_notifications():
+                    super().__setitem__(index, value)
+                return
+            value = list(value)
+            old_items = super().__getitem__(index)
+            super().__setitem__(index, value)
+            if old_items:
+                self._notify_removed_(start, old_items)
+            if value:
+                self._notify_inserted_(start, value)
+        else:
+            if index < 0:
+                index += len(self)
+            old_item = super().__getitem__(index)
+            super().__setitem__(index, value)
+            self._notify_removed_(index, [old_item])
+            self._notify_inserted_(index, [value])
 
     def clear(self):
         """
         Remove all items from list.
         """
+        items = list(self)
         super().clear()
+        if self._suspended > 0:
+            return
         self.on_clear.emit()
+        if items:
+            self.items_removed.emit(0, items)
+
+    def sort(self, *args, **kwargs):
+        """
+        Sort the list in place. (Triggers a reset notification)
+        """
+        super().sort(*args, **kwargs)
+        if self._suspended == 0:
+            self.items_reset.emit()
+
+    def reverse(self):
+        """
+        Reverse the list in place. (Triggers a reset notification)
+        """
+        super().reverse()
+        if self._suspended == 0:
+            self.items_reset.emit()
+
+    def _notify_inserted_(self, start, items):
+        """
+        Announce inserted items
+        :param start: index of the first inserted item
+        :param items: inserted items
+        """
+        if self._suspended > 0 or not items:
+            return
+        for item in items:
+            self.item_added.emit(item)
+        self.items_inserted.emit(start, items)
+
+    def _notify_removed_(self, start, items):
+        """
+        Announce removed items
+        :param start: index of the first removed item
+        :param items: removed items
+        """
+        if self._suspended > 0 or not items:
+            return
+        for item in items:
+            self.item_removed.emit(item)
+        self.items_removed.emit(start, items)
+
+    def _notify_reset_(self, snapshot):
+        """
+        Announce all changes made since the snapshot was taken
+        :param snapshot: previous content of the list
+        """
+        if len(snapshot) == len(self) and all(a is b for a, b in zip(snapshot, self)):
+            return  # nothing changed
+        self.items_reset.emit()
@@ -15,47 +15,268 @@ limitations under the License.
 """
 
 
+from QtModularUiPack.Framework.Extensions.gui_dispatcher import GuiDispatcher
+from QtModularUiPack.Framework.Extensions.instrumentation import Instrumentation
+from types import MethodType
+from weakref import ref
+from time import perf_counter
+
+
+_validators = dict()    # argument validators shared by all signals with the same argument types
+
+
+def _get_validator(types):
+    """
+    Returns a function that checks emitted arguments against the given types (built once per combination of types)
+    :param types: expected argument types
+    :return: validation function taking the argument tuple
+    """
+    validator = _validators.get(types)
+    if validator is not None:
+        return validator
+
+    count = len(types)
+    checked = tuple((i, t) for i, t in enumerate(types) if t is not object)     # object accepts everything
+
+    def wrong_count(args):
+        raise Exception('Expected {} arguments but got {}.'.format(count, len(args)))
+
+    def wrong_type(i, arg, t):
+        raise TypeError('Argument {} has the type "{}" but "{}" was expected.'.format(i, type(arg), t))
+
+    if not checked:
+        def validator(args):
+            if len(args) != count:
+                wrong_count(args)
+    elif len(checked) == 1:
+        index, arg_type = checked[0]
+
+        def validator(args):
+            if len(args) != count:
+                wrong_count(args)
+            arg = args[index]
+            if arg is not None and not isinstance(arg, arg_type):
+                wrong_type(index, arg, arg_type)
+    else:
+        def validator(args):
+            if len(args) != count:
+                wrong_count(args)
+            for i, t in checked:
+                arg = args[i]
+                if arg is not None and not isinstance(arg, t):
+                    wrong_type(i, arg, t)
+
+    _validators[types] = validator
+    return validator
+
+
+def _queued(function, signal_reference, key):
+    """
+    Wraps a function such that calls from other threads are executed on the Qt GUI thread
+    :param function: function to wrap
+    :param signal_reference: weak reference of the signal the function is connected to
+    :param key: key of the connection
+    :return: wrapped function
+    """
+    dispatcher = GuiDispatcher.instance
+
+    def run(*args):
+        signal = signal_reference()
+        if signal is not None and signal._callbacks.get(key, (None, None))[1] is deliver:
+            function(*args)     # calls posted before the connection was removed (or replaced) are dropped
+
+    def deliver(*args):
+        if dispatcher.is_gui_thread():
+            function(*args)
+        else:
+            dispatcher.post(run, *args)     # every emit is delivered, many emits share one event loop wakeup
+    return deliver
+
+
+def _handler_name(function):
+    """
+    Returns the name of a handler for instrumentation reports
+    :param function: handler function
+    :return: name
+    """
+    return getattr(function, '__qualname__', None) or repr(function)
+
+
+def _callback_key(callback):
+    """
+    Returns the key which identifies a connected callback (bound methods are identified by their object and function)
+    :param callback: callback function
+    :return: key
+    """
+    if isinstance(callback, MethodType):
+        return id(callback.__self__), callback.__func__
+    return callback
+
+
 class Signal(object):
     """
-    A signal to fire events
+    A signal to fire events.
+    Bound methods are connected through weak references by default, such that a connection does not keep the object
+    of the method alive. Connections of objects which were deleted are removed automatically.
+    Queued connections are always executed on the Qt GUI thread, no matter which thread emits the signal.
     """
 
-    def __init__(self, *types):
+    _validation_enabled = True
+    _instrumented = False
+
+    @classmethod
+    def set_validation_enabled(cls, enabled):
+        """
+        Enable or disable the type checks of emitted arguments for all signals (disable for production use)
+        :param enabled: True or False
+        """
+        Signal._validation_enabled = enabled
+        Signal._select_emit_()
+
+    @staticmethod
+    def _select_emit_(instrumented=None):
+        """
+        Select the emit implementation of all signals according to the validation and instrumentation settings
+        :param instrumented: (Optional) new state of the instrumentation
+        """
+        if instrumented is not None:
+            Signal._instrumented = instrumented
+        if Signal._instrumented:
+            Signal.emit = Signal._emit_instrumented_
+        else:
+            Signal.emit = Signal._emit_validated_ if Signal._validation_enabled else Signal._emit_unvalidated_
+
+    def __init__(self, *types, name=None):
+        """
+        :param types: types of the arguments
+        :param name: (Optional) name of the signal in instrumentation reports
+        """
         self._types = types
-        self._callbacks = list()
+        self.name = name
+        self._validate = _get_validator(types)
+        self._callbacks = dict()    # key -> (weak reference of the object or None, function) in order of connection
+        self._snapshot = None   # connections as tuple for iteration during emit (rebuilt after the connections changed)
 
     def __del__(self):
         self._types = list()
-        self._callbacks = list()
+        self._callbacks = dict()
+        self._snapshot = None
 
-    def connect(self, callback):
+    def connect(self, callback, weak=True, queued=False):
         """
         Connect callback function to signal
         :param callback: callback function to execute on signal
+        :param weak: if true a bound method does not keep its object alive (other callables and objects which cannot be
+                     referenced weakly are always held strongly)
+        :param queued: if true emits from other threads are delivered on the Qt GUI thread (in order of emission, calls
+                       which are still waiting when the callback is disconnected are dropped)
         """
-        if callback not in self._callbacks:
-            self._callbacks.append(callback)
+        key = _callback_key(callback)
+        if key in self._callbacks:
+            return
+
+        reference, function = None, callback
+        signal_reference = ref(self)
+        if weak and isinstance(callback, MethodType):
+            def purge(dead_reference):  # remove the connection as soon as the object of the method is deleted
+                signal = signal_reference()
+                if signal is not None:
+                    signal._remove_(key)
+            try:
+                # keep the object weakly and call the plain function with it (no bound method has to be created on emit)
+                reference, function = ref(callback.__self__, purge), callback.__func__
+            except TypeError:
+                pass    # the object does not support weak references (e.g. __slots__ without __weakref__) -> strong
+        self._callbacks[key] = (reference, _queued(function, signal_reference, key) if queued else function)
+        self._snapshot = None
 
     def disconnect(self, callback):
         """
         Disconnect callback function to signal
         :param callback: callback to disconnect from signal
         """
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        self._remove_(_callback_key(callback))
+
+    def _remove_(self, key):
+        """
+        Remove a connection
+        :param key: key of the callback
+        """
+        if self._callbacks.pop(key, None) is not None:
+            self._snapshot = None   # an emit in progress keeps iterating its own snapshot
+
+    def _get_snapshot_(self):
+        """
+        Returns the connections as tuple of (key, object reference, function) entries
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple((key, reference, function) for key, (reference, function) in self._callbacks.items())
+        return snapshot
 
-    def emit(self, *args):
+    def _emit_validated_(self, *args):
         """
         Emit signal to trigger callbacks
         :param args: arguments
         """
-        if len(args) != len(self._types):
-            raise Exception('Expected {} arguments but got {}.'.format(len(self._types), len(args)))
+        self._validate(args)
+        snapshot = self._snapshot or self._get_snapshot_()
+        callbacks = self._callbacks
+        for key, reference, function in snapshot:
+            if self._snapshot is not snapshot and key not in callbacks:
+                continue    # disconnected by a previous callback of this emit
+            if reference is None:
+                function(*args)
+            else:
+                instance = reference()
+                if instance is not None:
+                    function(instance, *args)
+
+    def _emit_unvalidated_(self, *args):
+        """
+        Emit signal to trigger callbacks (without checking the arguments)
+        :param args: arguments
+        """
+        snapshot = self._snapshot or self._get_snapshot_()
+        callbacks = self._callbacks
+        for key, reference, function in snapshot:
+            if self._snapshot is not snapshot and key not in callbacks:
+                continue    # disconnected by a previous callback of this emit
+            if reference is None:
+                function(*args)
+            else:
+                instance = reference()
+                if instance is not None:
+                    function(instance, *args)
+
+    def _emit_instrumented_(self, *args):
+        """
+        Emit signal to trigger callbacks and record the time spent in every callback (used while instrumentation is enabled)
+        :param args: arguments
+        """
+        if Signal._validation_enabled:
+            self._validate(args)
+        name = self.name
+        if name is None:    # unnamed signals are reported by their argument types and address
+            name = self.name = 'Signal({}) at {}'.format(', '.join(getattr(t, '__name__', str(t)) for t in self._types), hex(id(self)))
+        statistics = Instrumentation.instance.get_statistics('signal', name)
+        statistics.count += 1
+        snapshot = self._snapshot or self._get_snapshot_()
+        callbacks = self._callbacks
+        for key, reference, function in snapshot:
+            if self._snapshot is not snapshot and key not in callbacks:
+                continue    # disconnected by a previous callback of this emit
+            start = perf_counter()
+            if reference is None:
+                function(*args)
+            else:
+                instance = reference()
+                if instance is None:
+                    continue
+                function(instance, *args)
+            statistics.add(perf_counter() - start, _handler_name(function))
+
+    emit = _emit_validated_
 
-        for i in range(len(args)):
-            t = self._types[i]
-            if args[i] is not None and not isinstance(args[i], t):
-                raise TypeError('Argument {} has the type "{}" but "{}" was expected.'.format(i, type(args[i]), t))
 
-        for callback in self._callbacks:
-            callback(*args)
+Instrumentation.instance.add_switch(Signal._select_emit_)
@@ -1 +1,4 @@
 from QtModularUiPack.Framework.ImportTools.module_manager import ModuleManager
+from QtModularUiPack.Framework.ImportTools.static_discovery import ClassDescriptor
+from QtModularUiPack.Framework.ImportTools.folder_watcher import FolderWatcher
+from QtModularUiPack.Framework.ImportTools.warm_up import WarmUp
@@ -0,0 +1,268 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.ImportTools.discovery_cache import file_stamp, file_hash
+from time import perf_counter
+import traceback
+import importlib
+import ast
+import os
+import sys
+
+
+def imported_module_names(path):
+    """
+    Returns the names of all modules a python file might import (anywhere in the file).
+    For "import a.b" and "from a.b import c" the names "a", "a.b" and "a.b.c" are returned, since "c" may be a module.
+    :param path: path of the python file
+    :return: set of module names (empty if the file cannot be parsed)
+    """
+    try:
+        with open(path, 'rb') as file:
+            tree = ast.parse(file.read(), path)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            dotted = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.module is None:     # "from . import x" -> x is a module of the folder
+                dotted = [alias.name for alias in node.names]
+            else:
+                dotted = [node.module + '.' + alias.name for alias in node.names]
+        else:
+            continue
+        for name in dotted:
+            parts = name.split('.')
+            for i in range(1, len(parts) + 1):
+                names.add('.'.join(parts[:i]))
+    return names
+
+
+class _TrackedModule(object):
+    """
+    State of a module file at the time it was (re)loaded
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.stamp = file_stamp(path)
+        self.hash = file_hash(path) if self.stamp is not None else None
+        self._imports = None
+
+    @property
+    def imports(self):
+        """
+        Gets the module names imported by the file (parsed on first use)
+        """
+        if self._imports is None:
+            self._imports = imported_module_names(self.path)
+        return self._imports
+
+    def has_changed(self):
+        """
+        Check whether the file was modified since it was loaded (touched files with the same content are unchanged)
+        :return: True or False
+        """
+        stamp = file_stamp(self.path)
+        if stamp is None or stamp == self.stamp:
+            return False
+        if file_hash(self.path) == self.hash:
+            self.stamp = stamp
+            return False
+        return True
+
+
+class ReloadReport(object):
+    """
+    Summary of a reload: which modules were reloaded (in order), why and how long it took
+    """
+
+    def __init__(self):
+        self.changed = list()       # names of the modules whose files were modified
+        self.dependents = list()    # names of the modules which were reloaded because they import a changed module
+        self.reloaded = list()      # (module name, duration in s) in the order of reloading
+        self.failed = dict()        # module name -> exception
+        self.total_time = 0
+
+    def __bool__(self):
+        return len(self.reloaded) > 0 or len(self.failed) > 0
+
+    def __str__(self):
+        if not self:
+            return 'no modules changed (checked in {:.1f} ms)'.format(self.total_time * 1000)
+        lines = ['reloaded {} module(s) in {:.1f} ms ({} changed, {} dependent)'.format(
+            len(self.reloaded), self.total_time * 1000, len(self.changed), len(self.dependents))]
+        for name, duration in self.reloaded:
+            lines.append('  {:<40} {:>8.2f} ms{}'.format(name, duration * 1000, '' if name in self.changed else ' (dependent)'))
+        for name, error in self.failed.items():
+            lines.append('  {:<40} failed: {}'.format(name, error))
+        return '\n'.join(lines)
+
+
+class ModuleDependencyGraph(object):
+    """
+    Keeps track of the modules of some folders, the files they were loaded from and which of them import each other.
+    Modified modules are reloaded together with the modules depending on them (directly or indirectly), dependencies
+    before dependents, such that the dependents pick up the new classes.
+    """
+
+    def __init__(self):
+        self._folders = set()
+        self._modules = dict()      # module name -> tracked module
+        self._checked = dict()      # module name -> module object of sys.modules which was already examined
+        self._importers = None      # module name -> names of the tracked modules importing it (built on first use)
+
+    def add_folder(self, folder):
+        """
+        Track the modules which are loaded from a folder
+        :param folder: path of the folder
+        """
+        folder = os.path.abspath(folder)
+        if folder not in self._folders:
+            self._folders.add(folder)
+            self._checked.clear()   # modules imported before might belong to the new folder
+        self.update()
+
+    def update(self):
+        """
+        Start tracking the modules of the folders which were imported since the last update
+        """
+        for name, module in list(sys.modules.items()):
+            if self._checked.get(name) is module:
+                continue
+            self._checked[name] = module
+            path = getattr(module, '__file__', None)
+            if name not in self._modules and path is not None and os.path.dirname(os.path.abspath(path)) in self._folders:
+                self._track_(name, _TrackedModule(path))
+
+    def changed_modules(self):
+        """
+        Returns the names of the loaded modules whose files were modified
+        :return: list of module names
+        """
+        changed = list()
+        for name, tracked in list(self._modules.items()):
+            if name not in sys.modules:     # module was removed
+                self._untrack_(name)
+            elif tracked.has_changed():
+                changed.append(name)
+        return changed
+
+    def dependents(self, names):
+        """
+        Returns the modules which import one of the given modules (directly or indirectly)
+        :param names: module names
+        :return: set of module names (without the given ones)
+        """
+        if self._importers is None:
+            self._importers = dict()
+            for name, tracked in self._modules.items():
+                self._add_edges_(name, tracked)
+
+        result = set()
+        pending = list(names)
+        while len(pending) > 0:
+            for importer in self._importers.get(pending.pop(), ()):
+                if importer not in result and importer not in names:
+                    result.add(importer)
+                    pending.append(importer)
+        return result
+
+    def order(self, names):
+        """
+        Sort modules such that every module comes after the modules it imports (cycles are broken by name)
+        :param names: module names
+        :return: list of module names
+        """
+        names = set(names)
+        requires = {name: self._modules[name].imports & names - {name} for name in names}
+        ordered = list()
+        while len(requires) > 0:
+            ready = sorted(name for name, imports in requires.items() if len(imports) == 0)
+            if len(ready) == 0:     # import cycle
+                ready = [min(requires)]
+            for name in ready:
+                del requires[name]
+                ordered.append(name)
+            for imports in requires.values():
+                imports.difference_update(ready)
+        return ordered
+
+    def reload(self, force=False):
+        """
+        Reload the modified modules and the modules depending on them
+        :param force: reload all tracked modules
+        :return: reload report
+        """
+        start = perf_counter()
+        report = ReloadReport()
+        self.update()
+        if force:
+            report.changed = sorted(name for name in self._modules if name in sys.modules)
+        else:
+            report.changed = self.changed_modules()
+        report.dependents = sorted(self.dependents(report.changed))
+
+        for name in self.order(report.changed + report.dependents):
+            module_start = perf_counter()
+            try:
+                sys.modules[name] = importlib.reload(sys.modules[name])
+            except Exception as e:
+                traceback.print_exc()
+                report.failed[name] = e     # keep the old state such that it is retried with the next reload
+                continue
+            report.reloaded.append((name, perf_counter() - module_start))
+            path = self._modules[name].path
+            self._untrack_(name)
+            self._track_(name, _TrackedModule(path))    # new state and imports of the file
+
+        self.update()   # modules which are imported for the first time by the reloaded ones
+        report.total_time = perf_counter() - start
+        return report
+
+    def _track_(self, name, tracked):
+        """
+        Add a module to the graph
+        :param name: module name
+        :param tracked: tracked module
+        """
+        self._modules[name] = tracked
+        if self._importers is not None:
+            self._add_edges_(name, tracked)
+
+    def _untrack_(self, name):
+        """
+        Remove a module from the graph
+        :param name: module name
+        """
+        tracked = self._modules.pop(name)
+        if self._importers is not None:
+            for imported in tracked.imports:
+                if imported in self._importers:
+                    self._importers[imported].discard(name)
+
+    def _add_edges_(self, name, tracked):
+        """
+        Register the imports of a module
+        :param name: module name
+        :param tracked: tracked module
+        """
+        for imported in tracked.imports:
+            if imported != name:
+                self._importers.setdefault(imported, set()).add(name)
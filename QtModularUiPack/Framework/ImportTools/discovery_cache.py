@@ -0,0 +1,211 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from hashlib import sha1
+from threading import RLock
+import json
+import os
+import sys
+
+
+CACHE_FILE_NAME = 'qtmodularuipack_discovery.json'  # stored in the __pycache__ folder of the searched folder
+CACHE_VERSION = 1
+
+
+def file_stamp(path):
+    """
+    Returns modification time and size of a file
+    :param path: path of the file
+    :return: [mtime in ns, size] or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def file_hash(path):
+    """
+    Returns the SHA-1 hash of the content of a file
+    :param path: path of the file
+    :return: hex digest
+    """
+    with open(path, 'rb') as file:
+        return sha1(file.read()).hexdigest()
+
+
+class DiscoveryCache(object):
+    """
+    On-disk record of which classes of the python files in a folder derive from a given parent class, and of the
+    classes and imported names found by parsing the files (static discovery). An entry is valid as long as the file is unchanged (same modification time and size, or else the same content hash)
+    and all files which define classes of the inheritance hierarchies in the module are unchanged.
+    """
+
+    def __init__(self, folder):
+        """
+        :param folder: folder containing the python files
+        """
+        self._folder = folder
+        self._path = os.path.join(folder, '__pycache__', CACHE_FILE_NAME)
+        self._entries = dict()  # file name -> {'stamp': [mtime, size], 'hash': digest, 'results': {parent: result}, 'module': parsed}
+        self._changed = False
+        self._lock = RLock()    # used from the GUI thread and from the worker threads of folder watchers
+        try:
+            with open(self._path, 'r') as file:
+                data = json.loads(file.read())
+            if data.get('version') == CACHE_VERSION and data.get('python') == sys.version:
+                self._entries = data['entries']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass    # no or unreadable cache -> start over
+
+    def lookup(self, file_name, parent_name):
+        """
+        Returns the names of the classes of a file which derive from a parent class, if they are known
+        :param file_name: name of the python file in the folder
+        :param parent_name: name of the parent class
+        :return: list of class names or None if the file has to be examined
+        """
+        with self._lock:
+            entry = self._entries.get(file_name)
+            if entry is None or not self._is_file_unchanged_(file_name, entry):
+                return None
+            return self._lookup_result_(entry, parent_name)
+
+    def lookup_module(self, file_name):
+        """
+        Returns the classes and imported names of a file found by parsing it, if the file is unchanged
+        :param file_name: name of the python file in the folder
+        :return: dictionary (see StaticClassScanner) or None if the file has to be parsed
+        """
+        with self._lock:
+            entry = self._entries.get(file_name)
+            if entry is None or not self._is_file_unchanged_(file_name, entry):
+                return None
+            return entry.get('module')
+
+    def _lookup_result_(self, entry, parent_name):
+        """
+        Returns the recorded result of a parent class if the files of its class hierarchies are unchanged
+        :param entry: cache entry of the file
+        :param parent_name: name of the parent class
+        :return: list of class names or None
+        """
+        result = entry['results'].get(parent_name)
+        if result is None:
+            return None
+        for dependency, stamp in result['dependencies'].items():
+            if file_stamp(dependency) != stamp:     # the class hierarchy might have changed
+                del entry['results'][parent_name]
+                self._changed = True
+                return None
+        return result['classes']
+
+    def store(self, file_name, parent_name, class_names, classes):
+        """
+        Record the result of examining a file
+        :param file_name: name of the python file in the folder
+        :param parent_name: name of the parent class
+        :param class_names: names of the classes which derive from the parent class
+        :param classes: all classes of the module (their inheritance hierarchies are dependencies of the result)
+        """
+        with self._lock:
+            entry = self._get_entry_(file_name)
+            if entry is not None:
+                self._store_result_(entry, parent_name, class_names, classes)
+
+    def store_module(self, file_name, module):
+        """
+        Record the classes and imported names of a file found by parsing it
+        :param file_name: name of the python file in the folder
+        :param module: json serializable dictionary
+        """
+        with self._lock:
+            entry = self._get_entry_(file_name)
+            if entry is not None:
+                entry['module'] = module
+                self._changed = True
+
+    def _get_entry_(self, file_name):
+        """
+        Returns the entry of a file for its current state (a new one if the file has changed)
+        :param file_name: name of the python file in the folder
+        :return: cache entry or None if the file does not exist
+        """
+        path = os.path.join(self._folder, file_name)
+        stamp = file_stamp(path)
+        if stamp is None:
+            return None
+
+        entry = self._entries.get(file_name)
+        if entry is None or entry['stamp'] != stamp:
+            entry = {'stamp': stamp, 'hash': file_hash(path), 'results': dict()}
+            self._entries[file_name] = entry
+        return entry
+
+    def _store_result_(self, entry, parent_name, class_names, classes):
+        """
+        Record the classes derived from a parent class together with the files of their class hierarchies
+        """
+        dependencies = dict()
+        for cls in classes:
+            for base in cls.__mro__:
+                module = sys.modules.get(base.__module__)
+                dependency = getattr(module, '__file__', None)
+                if dependency is not None and dependency not in dependencies:
+                    dependencies[dependency] = file_stamp(dependency)
+        entry['results'][parent_name] = {'classes': list(class_names), 'dependencies': dependencies}
+        self._changed = True
+
+    def save(self):
+        """
+        Write the cache to disk if it has changed (a folder which is not writable only disables the cache)
+        """
+        with self._lock:
+            if not self._changed:
+                return
+            known = set(os.listdir(self._folder))
+            for file_name in list(self._entries):   # forget files which were deleted
+                if file_name not in known:
+                    del self._entries[file_name]
+            try:
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                with open(self._path, 'w') as file:
+                    file.write(json.dumps({'version': CACHE_VERSION, 'python': sys.version, 'entries': self._entries}))
+                self._changed = False
+            except OSError:
+                pass
+
+    def _is_file_unchanged_(self, file_name, entry):
+        """
+        Check whether a file is unchanged since the entry was recorded
+        :param file_name: name of the python file in the folder
+        :param entry: cache entry of the file
+        :return: True or False
+        """
+        path = os.path.join(self._folder, file_name)
+        stamp = file_stamp(path)
+        if stamp == entry['stamp']:
+            return True
+
+        if stamp is not None and file_hash(path) == entry['hash']:  # touched but not modified
+            entry['stamp'] = stamp
+            self._changed = True
+            return True
+
+        del self._entries[file_name]
+        self._changed = True
+        return False
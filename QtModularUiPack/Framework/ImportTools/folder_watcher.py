@@ -0,0 +1,242 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.Extensions import GuiDispatcher
+from PyQt5.QtCore import QFileSystemWatcher, QTimer
+from concurrent.futures import ThreadPoolExecutor
+import traceback
+import os
+
+
+def folder_snapshot(folder):
+    """
+    Returns the state of the python files of a folder
+    :param folder: path of the folder
+    :return: dictionary of file name -> (mtime in ns, size), None if the folder does not exist
+    """
+    try:
+        entries = os.scandir(folder)
+    except OSError:
+        return None
+    snapshot = dict()
+    with entries:
+        for entry in entries:
+            if entry.name[-3:].lower() == '.py':
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class FolderWatcher(object):
+    """
+    Watches folders containing python files and runs a discovery function for a folder whenever its files change.
+    File system notifications (QFileSystemWatcher) are used where possible, otherwise the folders are polled.
+    Bursts of notifications are merged (debounced), the discovery runs in a worker thread and its result is published
+    on the GUI thread. Discovery is only run if files were actually added, removed or modified.
+    """
+
+    @property
+    def polling(self):
+        """
+        True if all folders are polled instead of relying on file system notifications
+        """
+        return self._polling
+
+    def __init__(self, discover, publish, debounce=300, polling=False, poll_interval=1000):
+        """
+        :param discover: function(folder) -> result, runs in a worker thread (must not touch the GUI)
+        :param publish: function(folder, result), called on the GUI thread with the result of the discovery
+        :param debounce: time to wait for further notifications before the discovery runs (ms)
+        :param polling: poll the folders instead of using file system notifications
+        :param poll_interval: time between two checks of polled folders (ms)
+        """
+        self._discover = discover
+        self._publish = publish
+        self._polling = polling
+        self._folders = dict()      # folder -> generation (results requested before the folder was watched again are dropped)
+        self._generation = 0
+        self._snapshots = dict()    # folder -> snapshot of the last discovery (only accessed by the worker)
+        self._pending = set()       # folders with notifications which wait for the debounce timer
+        self._polled = set()        # folders without file system notifications
+        self._executor = None
+
+        self._watcher = None
+        if not polling:
+            self._watcher = QFileSystemWatcher()
+            self._watcher.directoryChanged.connect(self._on_directory_changed_)
+            self._watcher.fileChanged.connect(self._on_file_changed_)
+
+        self._debounce_timer = QTimer()
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce)
+        self._debounce_timer.timeout.connect(self._flush_)
+
+        self._poll_timer = QTimer()
+        self._poll_timer.setInterval(poll_interval)
+        self._poll_timer.timeout.connect(self._poll_)
+
+    def watch(self, folder):
+        """
+        Start watching a folder (the current state of the folder is the reference for later changes)
+        :param folder: path of the folder
+        """
+        folder = os.path.abspath(folder)
+        if folder in self._folders:
+            return
+        self._generation += 1
+        self._folders[folder] = self._generation
+        self._submit_(folder, self._generation, True)   # take the reference snapshot
+        if self._watcher is not None and self._watcher.addPath(folder):
+            self._watch_files_(folder)
+        else:   # no notifications for this folder (e.g. network drive or limit reached)
+            self._polled.add(folder)
+            self._poll_timer.start()
+
+    def unwatch(self, folder):
+        """
+        Stop watching a folder
+        :param folder: path of the folder
+        """
+        folder = os.path.abspath(folder)
+        if folder not in self._folders:
+            return
+        del self._folders[folder]
+        self._pending.discard(folder)
+        self._polled.discard(folder)
+        if len(self._polled) == 0:
+            self._poll_timer.stop()
+        if self._watcher is not None:
+            paths = [path for path in self._watcher.files() if os.path.dirname(path) == folder]
+            if folder in self._watcher.directories():
+                paths.append(folder)
+            if len(paths) > 0:
+                self._watcher.removePaths(paths)
+
+    def stop(self):
+        """
+        Stop watching all folders
+        """
+        for folder in list(self._folders):
+            self.unwatch(folder)
+        self._debounce_timer.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _watch_files_(self, folder):
+        """
+        Watch the python files of a folder for modifications (directory notifications only report added and removed
+        files). Files which were replaced (e.g. saved by an editor through renaming) are added again.
+        :param folder: path of the folder
+        """
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return
+        watched = set(self._watcher.files())
+        paths = [os.path.join(folder, name) for name in names if name[-3:].lower() == '.py']
+        paths = [path for path in paths if path not in watched]
+        if len(paths) > 0:
+            self._watcher.addPaths(paths)
+
+    def _on_directory_changed_(self, folder):
+        """
+        Callback for files which were added to or removed from a folder
+        :param folder: path of the folder
+        """
+        if folder in self._folders:
+            self._watch_files_(folder)
+            self._schedule_(folder)
+
+    def _on_file_changed_(self, path):
+        """
+        Callback for modified python files
+        :param path: path of the file
+        """
+        folder = os.path.dirname(path)
+        if folder in self._folders:
+            if os.path.exists(path) and path not in self._watcher.files():
+                self._watcher.addPath(path)     # replaced files are no longer watched
+            self._schedule_(folder)
+
+    def _schedule_(self, folder):
+        """
+        Run the discovery for a folder once no further notifications arrive for the debounce time
+        :param folder: path of the folder
+        """
+        self._pending.add(folder)
+        self._debounce_timer.start()    # restarts a running timer
+
+    def _flush_(self):
+        """
+        Callback of the debounce timer. Starts the discovery of all folders with notifications.
+        """
+        pending = self._pending
+        self._pending = set()
+        for folder in pending:
+            if folder in self._folders:
+                self._submit_(folder, self._folders[folder])
+
+    def _poll_(self):
+        """
+        Callback of the poll timer. Checks the polled folders in the worker thread.
+        """
+        for folder in self._polled:
+            self._submit_(folder, self._folders[folder])
+
+    def _submit_(self, folder, generation, reference=False):
+        """
+        Let the worker thread look for changes in a folder
+        :param folder: path of the folder
+        :param generation: generation of the folder at the time of the request
+        :param reference: only take the reference snapshot
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='FolderWatcher')
+        self._executor.submit(self._scan_, folder, generation, reference)
+
+    def _scan_(self, folder, generation, reference):
+        """
+        Compare the folder with its last state and run the discovery if it has changed (runs in the worker thread)
+        :param folder: path of the folder
+        :param generation: generation of the folder at the time of the request
+        :param reference: only take the reference snapshot
+        """
+        snapshot = folder_snapshot(folder)
+        if reference or snapshot == self._snapshots.get(folder):
+            self._snapshots[folder] = snapshot
+            return
+        self._snapshots[folder] = snapshot
+        try:
+            result = self._discover(folder) if snapshot is not None else None
+        except Exception as e:
+            traceback.print_exc()
+            print('discovery of "{}" failed. Error: {}'.format(folder, e))
+            return
+        GuiDispatcher.instance.post(self._publish_, folder, generation, result)
+
+    def _publish_(self, folder, generation, result):
+        """
+        Hand the result of a discovery to the owner (runs on the GUI thread)
+        :param folder: path of the folder
+        :param generation: generation of the folder at the time of the request
+        :param result: result of the discovery
+        """
+        if self._folders.get(folder) == generation:     # the folder might not be watched anymore
+            self._publish(folder, result)
@@ -15,8 +15,11 @@ limitations under the License.
 """
 
 from QtModularUiPack.Framework.Extensions import Singleton
-from QtModularUiPack.Framework.ImportTools.utils import is_non_strict_subclass, is_non_strict_type
-import importlib
+from QtModularUiPack.Framework.ImportTools.utils import is_non_strict_subclass
+from QtModularUiPack.Framework.ImportTools.discovery_cache import DiscoveryCache
+from QtModularUiPack.Framework.ImportTools.static_discovery import StaticClassScanner
+from QtModularUiPack.Framework.ImportTools.dependency_graph import ModuleDependencyGraph
+from QtModularUiPack.Framework.ImportTools.warm_up import WarmUp
 import os
 import sys
 
@@ -30,36 +33,65 @@ class ModuleManager(object):
     def __init__(self):
         self._dirty = dict()
         self.loaded_classes = dict()
+        self.use_discovery_cache = True     # skip the import of files which are known to contain no classes of interest
+        self._scanner = StaticClassScanner()
+        self._dependencies = ModuleDependencyGraph()     # modules of the folders classes were loaded from
+        self._warm_up = None
+        self._discovery_caches = dict()     # folder -> discovery cache (shared by imports and static discovery)
 
-    def reload_modules(self):
+    def reload_modules(self, force=False):
         """
-        Reloads all modules that were previously loaded by using the manager.
+        Reloads the modules loaded by using the manager (and the modules of their folders) whose files were modified,
+        together with all modules importing them, in dependency order.
         IMPORTANT: Does not reload all modules.
+        :param force: reload all modules of the folders whether they were modified or not
+        :return: reload report (reloaded modules and durations)
         """
-        modules_to_reload = list()      # store modules to reload
-        for path in self.loaded_classes:    # iterate through all loaded classes
-
+        for path in self.loaded_classes:
             # mark given class path as dirty
             # -> this means that the classes were reloaded but that if the load_classes_from_folder_derived_from() method
             #    is called again it should not just return the known types but also look for new ones.
             self._dirty[path] = True
 
-            for cls in self.loaded_classes[path]:
-                class_module = sys.modules[cls.__module__]  # get the module of the class
+        return self._dependencies.reload(force)
 
-                # check for modules that are being used by this module to reload them as well
-                for member_key in class_module.__dict__:
-                    member = class_module.__dict__[member_key]
-                    if isinstance(member, type):    # check if the member is a class
-                        if member.__module__ not in modules_to_reload:  # check if the members module is already scheduled to be reloaded
-                            modules_to_reload.append(member.__module__)
+    def warm_up(self, folders, modules=None, workers=0):
+        """
+        Compile the python files of plugin folders in parallel processes and optionally import modules, in the
+        background. Loading all classes of these folders waits for the compilation instead of compiling on the calling
+        thread (loading a single class does not wait, it only compiles its own module if necessary).
+        :param folders: folders containing python files (e.g. frame search path and experiment folders)
+        :param modules: (Optional) names of modules to import in the background (e.g. heavy third party libraries)
+        :param workers: number of compiling processes (0: one per CPU, no compilation if there is only one CPU)
+        :return: warm-up (can be used to wait for it)
+        """
+        self._warm_up = WarmUp(folders, modules, workers)
+        self._warm_up.start()
+        return self._warm_up
 
-                if cls.__module__ not in modules_to_reload:     # schedule class module to be reloaded if not done already
-                    modules_to_reload.append(cls.__module__)
+    def find_classes_derived_from(self, path, parent_class):
+        """
+        Finds all classes in a folder which inherit from a given parent type without importing the python files.
+        The sources are parsed instead, a class is only imported when it is loaded with load_class().
+        Classes which are only imported into the files of the folder (defined elsewhere) are not found.
+        The parsed files are kept in the discovery cache of the folder (if use_discovery_cache is set).
+        :param path: Path to look for classes
+        :param parent_class: class that should be inherited
+        :return: list of class descriptors (with the "name" of the class, module name and path)
+        """
+        cache = self._get_discovery_cache_(path) if self.use_discovery_cache else None
+        return self._scanner.find_classes_derived_from(path, parent_class.__name__, getattr(parent_class, 'name', None),
+                                                       cache)
 
-        # reload all modules that have dependencies on the classes
-        for module_path in modules_to_reload:
-            sys.modules[module_path] = importlib.reload(sys.modules[module_path])
+    def load_class(self, descriptor):
+        """
+        Import the class of a descriptor found by find_classes_derived_from()
+        :param descriptor: class descriptor
+        :return: class
+        """
+        cls = descriptor.load()
+        self._dependencies.add_folder(os.path.dirname(descriptor.path))     # reload it along with the other modules
+        return cls
 
     def load_classes_from_folder_derived_from(self, path, parent_class):
         """
@@ -79,6 +111,9 @@ class ModuleManager(object):
             return self.loaded_classes[path]     # return already loaded types if they are not marked dirty
 
         types_loaded = list()
+        known_names = set()     # qualified names of the loaded types (same comparison as is_non_strict_type())
+        cache = self._get_discovery_cache_(path) if self.use_discovery_cache else None
+        self._wait_for_warm_up_(path)
 
         for file in os.listdir(path):
             if file[-3:].lower() == '.py':  # check if file is a python script
@@ -88,26 +123,51 @@ class ModuleManager(object):
                     sys.path.append(path)   # append the module path to the environment
 
                 if module_name not in sys.modules:  # only do this if the module wasn't already reloaded before and is present (otherwise the classes cannot be extracted properly)
+                    if cache is not None and cache.lookup(file, parent_class.__name__) == []:
+                        continue    # unchanged file without classes of interest -> no need to import it
                     module = __import__(module_name)    # import the module
                     sys.modules[module_name] = module
                 else:
                     module = sys.modules[module_name]
 
                 mod_dict = module.__dict__
-                for name in mod_dict:   # search for valid classes
-                    cls = mod_dict[name]
-                    if isinstance(cls, type) and is_non_strict_subclass(mod_dict[name], parent_class):    # check if sub class of EmptyFrame
+                found = list()  # names of the classes of interest in this module
+                for cls in mod_dict.values():   # search for valid classes
+                    if isinstance(cls, type) and is_non_strict_subclass(cls, parent_class):    # check if sub class of EmptyFrame
+                        found.append(cls.__name__)
                         # add the class to the list of loaded types but only if it is not already present
                         # -> this is necessary since the imports in different modules will produce duplicates
-                        already_present = False
-                        for added_class in types_loaded:
-                            if is_non_strict_type(cls, added_class):
-                                already_present = True
-                                break
-                        if not already_present:
+                        if cls.__qualname__ not in known_names:
+                            known_names.add(cls.__qualname__)
                             types_loaded.append(cls)
 
+                if cache is not None:   # remember the result together with the class hierarchies it depends on
+                    module_classes = [member for member in mod_dict.values() if isinstance(member, type)]
+                    cache.store(file, parent_class.__name__, found, module_classes)
+
+        if cache is not None:
+            cache.save()
+        self._dependencies.add_folder(path)
         self.loaded_classes[path] = types_loaded
         self._dirty[path] = False
         return types_loaded
 
+    def _wait_for_warm_up_(self, path):
+        """
+        Wait until a running warm-up has compiled the files of a path (no need to compile them on this thread)
+        :param path: file or folder
+        """
+        if self._warm_up is not None and not self._warm_up.compiled and self._warm_up.covers(path):
+            self._warm_up.wait_compiled()
+
+    def _get_discovery_cache_(self, path):
+        """
+        Returns the discovery cache of a folder (loaded from disk once)
+        :param path: folder
+        :return: discovery cache
+        """
+        key = os.path.abspath(path)
+        cache = self._discovery_caches.get(key)
+        if cache is None:
+            cache = self._discovery_caches.setdefault(key, DiscoveryCache(path))    # also called by watcher threads
+        return cache
@@ -0,0 +1,418 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.ImportTools.utils import mro_names
+from importlib.machinery import PathFinder
+from threading import Lock
+import ast
+import os
+import sys
+
+
+_COMPUTED = object()    # value of class attributes which are not literals (only known once the module is imported)
+
+
+class ClassDescriptor(object):
+    """
+    Lightweight description of a class which was found in a python file without importing it.
+    The module is only imported when the class is loaded.
+    """
+
+    def __init__(self, name, class_name, module_name, path):
+        """
+        :param name: value of the "name" attribute of the class (display name of frames and experiments)
+        :param class_name: name of the class
+        :param module_name: name of the module defining the class
+        :param path: path of the python file
+        """
+        self.name = name
+        self.class_name = class_name
+        self.module_name = module_name
+        self.path = path
+
+    def __repr__(self):
+        return '<ClassDescriptor {} in {}>'.format(self.class_name, self.path)
+
+    def load(self):
+        """
+        Import the module (if not done already) and return the class
+        :return: class
+        """
+        folder = os.path.dirname(self.path)
+        if folder not in sys.path:
+            sys.path.append(folder)     # append the module path to the environment
+        module = sys.modules.get(self.module_name)
+        if module is None:
+            module = __import__(self.module_name)
+            sys.modules[self.module_name] = module
+        return getattr(module, self.class_name)
+
+
+def _dotted_name(node):
+    """
+    Returns the dotted name of a name or attribute expression (e.g. "QtModularUiPack.Widgets.EmptyFrame")
+    :param node: ast node
+    :return: name or None if the expression is something else
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _dotted_name(node.value)
+        return None if value is None else value + '.' + node.attr
+    return None
+
+
+class _ModuleInfo(object):
+    """
+    Classes and imported names found in the source of a module
+    """
+
+    def __init__(self, module_name, path, tree=None, package='', data=None):
+        """
+        :param module_name: name of the module
+        :param path: path of the python file
+        :param tree: parsed source (ast)
+        :param package: package of the module (relative imports), empty for the modules of a plugin folder
+        :param data: (Optional) result of to_data() to restore the information instead of collecting it from the tree
+        """
+        self.module_name = module_name
+        self.path = path
+        self.package = package
+        self.classes = dict()   # class name -> (dotted names of the bases, class attributes (literal values or _COMPUTED))
+        self.aliases = dict()   # local name -> dotted name it refers to
+        self.constants = dict()     # module level name -> literal value
+        if data is not None:
+            self.aliases = dict(data['aliases'])     # copies, the data stays in the cache
+            for name, (bases, attributes, computed) in data['classes'].items():
+                attributes = dict(attributes)
+                attributes.update((attribute, _COMPUTED) for attribute in computed)
+                self.classes[name] = (list(bases), attributes)
+        else:
+            self._collect_(tree.body)
+
+    def to_data(self):
+        """
+        Returns the classes and aliases as json serializable dictionary (values which json cannot represent are stored
+        as computed)
+        """
+        classes = dict()
+        for name, (bases, attributes) in self.classes.items():
+            literals = {attribute: value for attribute, value in attributes.items()
+                        if value is None or isinstance(value, (str, int, float, bool))}
+            computed = [attribute for attribute in attributes if attribute not in literals]
+            classes[name] = [bases, literals, computed]
+        return {'classes': classes, 'aliases': self.aliases}
+
+    def _literal_(self, node):
+        """
+        Returns the value of an expression if it is a literal or a module level constant defined before
+        :param node: ast node
+        :return: value or _COMPUTED
+        """
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name) and node.id in self.constants:
+            return self.constants[node.id]
+        return _COMPUTED
+
+    def _absolute_(self, module, level):
+        """
+        Returns the absolute name of an imported module
+        :param module: module name of the import statement (None for "from . import x")
+        :param level: number of leading dots
+        :return: module name or None if it cannot be determined
+        """
+        if level == 0 or not self.package:  # plugin folders are no packages -> "from .x import y" is taken as "x"
+            return module
+        parts = self.package.split('.')
+        if level - 1 >= len(parts):
+            return None
+        base = '.'.join(parts[:len(parts) - level + 1])
+        return base + '.' + module if module else base
+
+    def _collect_(self, statements):
+        """
+        Collect the module level definitions (including the ones in if and try blocks)
+        :param statements: list of statements
+        """
+        for node in statements:
+            if isinstance(node, ast.ClassDef):
+                bases = [name for name in (_dotted_name(base) for base in node.bases) if name is not None]
+                attributes = dict()
+                for statement in node.body:
+                    if isinstance(statement, ast.Assign):
+                        targets = statement.targets
+                    elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                        targets = [statement.target]
+                    else:
+                        continue
+                    value = self._literal_(statement.value)
+                    for target in targets:
+                        if isinstance(target, ast.Name):
+                            attributes[target.id] = value
+                self.classes[node.name] = (bases, attributes)
+                self.aliases.pop(node.name, None)
+            elif isinstance(node, ast.ImportFrom):
+                module = self._absolute_(node.module, node.level)
+                if module is not None:
+                    for alias in node.names:
+                        self.aliases[alias.asname or alias.name] = module + '.' + alias.name
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname is not None:
+                        self.aliases[alias.asname] = alias.name
+                    else:
+                        head = alias.name.split('.')[0]
+                        self.aliases[head] = head
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                name = node.targets[0].id
+                target = _dotted_name(node.value)   # e.g. "Base = EmptyFrame"
+                if target is not None and target != name:
+                    self.aliases[name] = target
+                elif isinstance(node.value, ast.Constant):  # e.g. "FRAME_NAME = 'my frame'"
+                    self.constants[name] = node.value.value
+            elif isinstance(node, ast.If):
+                self._collect_(node.body)
+                self._collect_(node.orelse)
+            elif isinstance(node, ast.Try):
+                self._collect_(node.body)
+                for handler in node.handlers:
+                    self._collect_(handler.body)
+                self._collect_(node.orelse)
+
+
+class StaticClassScanner(object):
+    """
+    Finds the classes in the python files of a folder which derive (directly or indirectly) from a base class, by
+    parsing the sources instead of importing them.
+    Bases are resolved through imports, "import ... as ..." and assignments, across the files of the folder and into
+    modules outside of it: classes of modules which are already imported are checked through their MRO, the sources of
+    other modules are located and parsed (without importing them).
+    The parsed files of a folder can be kept in a discovery cache such that unchanged files are not parsed again.
+    As everywhere in the framework, classes are compared by name such that reloaded classes are still recognized.
+    """
+
+    def __init__(self):
+        self._parsed = dict()   # path -> ((mtime, size), module info or None)
+        self._locations = dict()    # name of a module outside the folders -> (path, package) or None
+        self._lock = Lock()     # discovery runs on the GUI thread and in the worker threads of folder watchers
+
+    def find_classes_derived_from(self, path, base_name, default_name=None, cache=None):
+        """
+        Find the classes derived from a base class
+        :param path: folder containing the python files
+        :param base_name: name of the base class
+        :param default_name: (Optional) display name of classes which do not define a "name" attribute (class name if None)
+        :param cache: (Optional) discovery cache of the folder (saved afterwards)
+        :return: list of class descriptors
+        """
+        with self._lock:
+            modules = dict()
+            for file in sorted(os.listdir(path)):
+                if file[-3:].lower() == '.py':
+                    info = self._parse_(os.path.join(path, file), os.path.splitext(file)[0], cache=cache)
+                    if info is not None:
+                        modules[info.module_name] = info
+            if cache is not None:
+                cache.save()
+
+            memo = dict()
+            descriptors = list()
+            known = set()
+            for info in modules.values():
+                for class_name in info.classes:
+                    if class_name in known or class_name == base_name:  # duplicates are only reported once
+                        continue
+                    if self._derives_(modules, info, class_name, base_name, memo, set()):
+                        known.add(class_name)
+                        name = self._attribute_(modules, info, class_name, 'name', set())
+                        if name is None:
+                            name = default_name if default_name is not None else class_name
+                        elif not isinstance(name, str):     # computed name -> the class name is the best guess
+                            name = class_name
+                        descriptors.append(ClassDescriptor(name, class_name, info.module_name, info.path))
+            return descriptors
+
+    def _parse_(self, path, module_name, package='', cache=None):
+        """
+        Parse a python file (the result is kept until the file changes)
+        :param path: path of the file
+        :param module_name: name of the module
+        :param package: package of the module (relative imports)
+        :param cache: (Optional) discovery cache of the folder of the file
+        :return: module info or None if the file cannot be parsed
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        file_name = os.path.basename(path)
+        data = cache.lookup_module(file_name) if cache is not None else None
+        if data is not None:
+            info = _ModuleInfo(module_name, path, package=package, data=data)
+        else:
+            try:
+                with open(path, 'rb') as file:
+                    tree = ast.parse(file.read(), path)
+                info = _ModuleInfo(module_name, path, tree, package)
+            except (SyntaxError, ValueError) as e:
+                print('unable to parse "{}". Error: {}'.format(path, e))
+                info = None
+            if info is not None and cache is not None:
+                cache.store_module(file_name, info.to_data())
+        self._parsed[path] = (stamp, info)
+        return info
+
+    def _external_module_(self, module_name):
+        """
+        Parse the source of a module outside of the scanned folders without importing it (or its packages)
+        :param module_name: absolute module name
+        :return: module info or None if there is no python source
+        """
+        if module_name not in self._locations:
+            location = None
+            search_path = None
+            spec = None
+            for i, part in enumerate(module_name.split('.')):
+                name = '.'.join(module_name.split('.')[:i + 1])
+                try:
+                    spec = PathFinder.find_spec(name, search_path)
+                except (ImportError, ValueError):
+                    spec = None
+                if spec is None:
+                    break
+                search_path = spec.submodule_search_locations
+            if spec is not None and spec.origin is not None and spec.origin.endswith('.py'):
+                is_package = spec.submodule_search_locations is not None
+                location = (spec.origin, module_name if is_package else module_name.rpartition('.')[0])
+            self._locations[module_name] = location
+
+        location = self._locations[module_name]
+        if location is None:
+            return None
+        return self._parse_(location[0], module_name, location[1])
+
+    def _resolve_(self, modules, info, dotted, seen):
+        """
+        Resolve a dotted name used in a module to a class of the folder
+        :param modules: module infos of the folder by module name
+        :param info: module in which the name is used
+        :param dotted: dotted name
+        :param seen: names resolved so far (protects against cyclic aliases)
+        :return: (module info, class name) of a class of the folder, or (None, final dotted name)
+        """
+        key = (info.path, dotted)
+        if key in seen:
+            return None, dotted
+        seen.add(key)
+
+        head, _, rest = dotted.partition('.')
+        if not rest and head in info.classes:
+            return info, head
+        if head in info.aliases:
+            target = info.aliases[head] + ('.' + rest if rest else '')
+            module_name, _, class_name = target.rpartition('.')
+            if not module_name:     # assignment of another name of this module (e.g. "Base = MyFrame")
+                return self._resolve_(modules, info, class_name, seen)
+            if module_name in modules:  # refers to a name in another file of the folder
+                return self._resolve_(modules, modules[module_name], class_name, seen)
+            return None, target
+        return None, dotted
+
+    def _lookup_(self, modules, info, dotted):
+        """
+        Find the class a base name refers to, also outside of the folder
+        :param modules: module infos of the folder by module name
+        :param info: module in which the name is used
+        :param dotted: dotted name
+        :return: (module info, class name, None) for parsed classes, (None, dotted name, class) for imported classes or
+                 (None, dotted name, None) if the class is unknown
+        """
+        base_info, resolved = self._resolve_(modules, info, dotted, set())
+        seen = set()
+        while base_info is None and resolved not in seen:
+            seen.add(resolved)
+            module_name, _, class_name = resolved.rpartition('.')
+            if not module_name:
+                break
+            module = sys.modules.get(module_name)
+            if module is not None:  # imported already -> the class itself can be examined
+                cls = getattr(module, class_name, None)
+                return None, resolved, cls if isinstance(cls, type) else None
+            external = self._external_module_(module_name)
+            if external is None:
+                break
+            base_info, target = self._resolve_(modules, external, class_name, set())
+            if base_info is None and target == class_name:
+                break   # not defined in that module
+            resolved = target
+        return base_info, resolved, None
+
+    def _derives_(self, modules, info, class_name, base_name, memo, visiting):
+        """
+        Check if a class derives from the base class
+        :return: True or False
+        """
+        key = (info.path, class_name)
+        if key in memo:
+            return memo[key]
+        if key in visiting:
+            return False
+        visiting.add(key)
+
+        result = False
+        for base in info.classes[class_name][0]:
+            base_info, resolved, cls = self._lookup_(modules, info, base)
+            if resolved.rpartition('.')[2] == base_name:
+                result = True
+            elif cls is not None:
+                result = base_name in mro_names(cls)    # the whole hierarchy of the imported class
+            elif base_info is not None:
+                result = self._derives_(modules, base_info, resolved, base_name, memo, visiting)
+            if result:
+                break
+        memo[key] = result
+        return result
+
+    def _attribute_(self, modules, info, class_name, attribute, visiting):
+        """
+        Returns a class attribute, looking through the bases (depth first, left to right)
+        :return: value, _COMPUTED if it is not a literal or None if it is not defined
+        """
+        key = (info.path, class_name)
+        if key in visiting:
+            return None
+        visiting.add(key)
+
+        bases, attributes = info.classes[class_name]
+        if attribute in attributes:
+            return attributes[attribute]
+        for base in bases:
+            base_info, resolved, cls = self._lookup_(modules, info, base)
+            if cls is not None:
+                value = getattr(cls, attribute, None)   # value of the imported class
+            elif base_info is not None:
+                value = self._attribute_(modules, base_info, resolved, attribute, visiting)
+            else:
+                value = None
+            if value is not None:
+                return value
+        return None
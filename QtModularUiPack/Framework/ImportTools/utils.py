@@ -14,6 +14,25 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from weakref import WeakKeyDictionary
+
+
+_mro_names = WeakKeyDictionary()    # class -> qualified names of all classes in its method resolution order
+
+
+def mro_names(cls):
+    """
+    Returns the qualified names of a class and all of its (direct and indirect) base classes.
+    The result is remembered per class object, reloaded classes are new objects and the old entries disappear with them.
+    :param cls: class
+    :return: frozenset of qualified names
+    """
+    names = _mro_names.get(cls)
+    if names is None:
+        names = frozenset(base.__qualname__ for base in cls.__mro__)
+        _mro_names[cls] = names
+    return names
+
 
 def is_non_strict_type(type1, compare_type):
     """
@@ -25,7 +44,7 @@ def is_non_strict_type(type1, compare_type):
     :param compare_type: type to compare the type in question to
     :return: True or False
     """
-    if isinstance(type1, type) and type1.__name__ == compare_type.__name__:
+    if isinstance(type1, type) and type1.__qualname__ == compare_type.__qualname__:
         return True
     else:
         return False
@@ -33,7 +52,8 @@ def is_non_strict_type(type1, compare_type):
 
 def is_non_strict_subclass(subtype, parent_type):
     """
-    Returns true if the given type inherits the subtype but does it less rigorous than issubclass().
+    Returns true if the given type inherits the subtype (directly or indirectly) but does it less rigorous than
+    issubclass(). Classes are compared by their qualified names.
     The main advantage is that classes of modules which where reloaded during runtime are still recognized as sub classes
     of previously loaded module classes.
     WARNING: If the name of a class in a different module is the same as in the module in question, this method will
@@ -42,12 +62,6 @@ def is_non_strict_subclass(subtype, parent_type):
     :param parent_type: Parent that was inherited
     :return: True or False
     """
-    if is_non_strict_type(subtype, parent_type):
-        return True
-
-    if hasattr(subtype, '__bases__'):
-        base_classes = list(subtype.__bases__)
-        for base_class in base_classes:
-            if base_class.__name__ == parent_type.__name__:
-                return True
-    return False
\ No newline at end of file
+    if not isinstance(subtype, type):
+        return False
+    return parent_type.__qualname__ in mro_names(subtype)    # the whole hierarchy, not only the direct base classes
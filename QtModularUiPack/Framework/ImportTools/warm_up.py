@@ -0,0 +1,154 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from threading import Thread, Event
+from time import perf_counter
+import subprocess
+import traceback
+import importlib
+import os
+import sys
+
+
+COMPILE_TIMEOUT = 120   # s, the compilation is given up after this time (the imports compile what is missing)
+
+
+class WarmUp(object):
+    """
+    Prepares plugin folders for a fast first import while the application is starting.
+    The python files of the folders are compiled to __pycache__ by a separate process (compileall with a pool of worker
+    processes, up-to-date files are skipped). Afterwards modules (e.g. heavy third party libraries) can be imported in
+    the background thread such that the GUI thread finds them in sys.modules.
+    """
+
+    @property
+    def compiled(self):
+        """
+        True if the compilation has finished (successfully or not)
+        """
+        return self._compiled.is_set()
+
+    @property
+    def done(self):
+        """
+        True if compilation and imports have finished
+        """
+        return self._done.is_set()
+
+    @property
+    def compile_time(self):
+        """
+        Gets the duration of the compilation in seconds (None while running)
+        """
+        return self._compile_time
+
+    @property
+    def import_time(self):
+        """
+        Gets the duration of the imports in seconds (None while running)
+        """
+        return self._import_time
+
+    def __init__(self, folders, modules=None, workers=0):
+        """
+        :param folders: folders containing python files (folders which do not exist are ignored)
+        :param modules: (Optional) names of modules to import in the background
+        :param workers: number of compiling processes (0: one per CPU, no compilation if there is only one CPU)
+        No compilation takes place in frozen applications.
+        """
+        self.folders = [os.path.abspath(folder) for folder in folders if folder is not None and os.path.isdir(folder)]
+        self.modules = list(modules) if modules is not None else list()
+        self.failed_modules = dict()    # module name -> exception
+        self._workers = workers
+        self._compiled = Event()
+        self._done = Event()
+        self._compile_time = None
+        self._import_time = None
+        self._thread = None
+
+    def covers(self, path):
+        """
+        Check if a file or folder is compiled by the warm-up
+        :param path: path
+        :return: True or False
+        """
+        path = os.path.abspath(path)
+        return any(path == folder or path.startswith(folder + os.sep) for folder in self.folders)
+
+    def start(self):
+        """
+        Start the warm-up in a background thread
+        """
+        if self._thread is None:
+            self._thread = Thread(target=self._run_, name='WarmUp', daemon=True)
+            self._thread.start()
+
+    def wait_compiled(self, timeout=None):
+        """
+        Wait for the compilation to finish
+        :param timeout: (Optional) maximum time to wait in seconds
+        :return: True if the compilation has finished
+        """
+        return self._compiled.wait(timeout)
+
+    def wait(self, timeout=None):
+        """
+        Wait for compilation and imports to finish
+        :param timeout: (Optional) maximum time to wait in seconds
+        :return: True if the warm-up has finished
+        """
+        return self._done.wait(timeout)
+
+    def _run_(self):
+        """
+        Thread worker compiling the folders and importing the modules
+        """
+        try:
+            start = perf_counter()
+            # with a single CPU the compiling process only competes with the starting application, frozen applications
+            # have no interpreter to run compileall (sys.executable is the application itself)
+            if len(self.folders) > 0 and not getattr(sys, 'frozen', False) and \
+                    (self._workers > 0 or (os.cpu_count() or 1) > 1):
+                self._compile_()
+            self._compile_time = perf_counter() - start
+        finally:
+            self._compiled.set()
+
+        try:
+            start = perf_counter()
+            for name in self.modules:
+                try:
+                    importlib.import_module(name)
+                except Exception as e:
+                    traceback.print_exc()
+                    self.failed_modules[name] = e
+            self._import_time = perf_counter() - start
+        finally:
+            self._done.set()
+
+    def _compile_(self):
+        """
+        Compile the folders in a separate process. A fresh interpreter is used instead of forking the application
+        (its threads and Qt state must not be copied, scripts without main guard must not be executed again).
+        """
+        command = [sys.executable, '-m', 'compileall', '-q', '-j', str(self._workers)]
+        if sys.flags.optimize > 0:
+            command += ['-o', str(sys.flags.optimize)]  # the byte code the imports of this interpreter are looking for
+        try:
+            subprocess.run(command + self.folders, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           timeout=COMPILE_TIMEOUT)
+        except (OSError, subprocess.SubprocessError) as e:
+            print('unable to compile plugin folders. Error: {}'.format(e))  # the imports compile the files themselves
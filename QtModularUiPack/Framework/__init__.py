@@ -2,5 +2,11 @@ from .Extensions.signal import Signal
 from .Extensions.observable_list import ObservableList
 from .ImportTools.utils import is_non_strict_subclass, is_non_strict_type
 from .ImportTools.module_manager import ModuleManager
+from .ImportTools.static_discovery import ClassDescriptor
+from .ImportTools.folder_watcher import FolderWatcher
+from .ImportTools.warm_up import WarmUp
 from .Extensions.code_environment import CodeEnvironment
 from .Extensions.killable_thread import KillableThread
+from .Extensions.gui_dispatcher import GuiDispatcher
+from .Extensions.async_signal import AsyncSignal, AsyncEmission, AsyncEventLoop
+from .Extensions.instrumentation import Instrumentation
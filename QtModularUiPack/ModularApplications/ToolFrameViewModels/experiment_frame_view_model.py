@@ -15,12 +15,13 @@ limitations under the License.
 """
 
 from QtModularUiPack.ViewModels import BaseContextAwareViewModel
-from QtModularUiPack.Framework import KillableThread, ModuleManager, ObservableList, is_non_strict_type, Signal
+from QtModularUiPack.Framework import KillableThread, ModuleManager, ObservableList, Signal, ClassDescriptor, FolderWatcher
 from QtModularUiPack.Framework.Experiments import BaseExperiment
 from PyQt5.QtWidgets import QFileDialog
 from PyQt5.QtCore import pyqtSlot, QObject
 import json
 import os
+import traceback
 
 
 EXPERIMENT_CONFIG = 'experiment_config.json'
@@ -48,17 +49,41 @@ class ExperimentOverviewViewModel(BaseContextAwareViewModel):
         Sets the path of the folder where the python scripts containing experiments are
         :param value: path
         """
+        if self._watcher is not None and self._experiment_folder is not None:
+            self._watcher.unwatch(self._experiment_folder)
         self._experiment_folder = value
+        if self._watcher is not None and value is not None:
+            self._watcher.watch(value)
         for experiment in self.experiments:
             experiment.experiment_folder = value
 
+    @property
+    def watch_experiment_folder(self):
+        """
+        True if the experiment folder is watched for new, removed or renamed experiments (discovered in the background)
+        """
+        return self._watcher is not None
+
+    @watch_experiment_folder.setter
+    def watch_experiment_folder(self, value):
+        """
+        Starts or stops watching the experiment folder
+        :param value: True or False
+        """
+        if value and self._watcher is None:
+            self._watcher = FolderWatcher(self._find_experiments_, self._on_experiments_found_)
+            if self._experiment_folder is not None:
+                self._watcher.watch(self._experiment_folder)
+        elif not value and self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
     def __init__(self, experiment_folder=None):
+        self.experiments = ObservableList()     # list that contains the experiment data-contexts (needed when the base class sets the registry)
         super().__init__()
-        self.experiments = ObservableList()     # list that contains the experiment data-contexts
         self.experiments.item_added.connect(self._experiment_added_)    # listen for experiments which are added
         self._experiment_folder = experiment_folder     # member for storing the experiment folder path
-        self.other_data_contexts.item_added.connect(self._data_contexts_changed_)   # listen for data contexts that appear in the application
-        self.other_data_contexts.item_removed.connect(self._data_contexts_changed_) # listen for data contexts that disappear from the application
+        self._watcher = None    # (Optional) watcher of the experiment folder
 
     def add_experiment(self, cannot_be_removed=False):
         """
@@ -106,21 +131,38 @@ class ExperimentOverviewViewModel(BaseContextAwareViewModel):
         if path != '':
             self.experiment_folder = path
 
-    def _data_contexts_changed_(self, vm):
+    def _find_experiments_(self, path):
+        """
+        Find the experiments of a folder (runs in the worker thread of the watcher)
+        :param path: folder
+        :return: list of class descriptors
+        """
+        return ModuleManager.instance.find_classes_derived_from(path, BaseExperiment)
+
+    def _on_experiments_found_(self, path, experiments):
         """
-        Callback for handling changes in the available other data contexts.
-        This method updates the experiments that they can access these contexts
-        :param vm: data context that caused the signal
+        Callback of the watcher with the experiments of the folder after files have changed (runs on the GUI thread)
+        :param path: folder
+        :param experiments: list of class descriptors (None if the folder does not exist anymore)
         """
         for experiment in self.experiments:
-            experiment.other_data_contexts = self.other_data_contexts
+            experiment.update_experiments(experiments if experiments is not None else list())
+
+    def _data_context_registry_changed_(self):
+        """
+        Callback for handling a new registry of the available other data contexts.
+        This method updates the experiments that they can access these contexts (changes within the registry reach the
+        experiments directly)
+        """
+        for experiment in self.experiments:
+            experiment.data_context_registry = self.data_context_registry
 
     def _experiment_added_(self, experiment: BaseContextAwareViewModel):
         """
         Callback for handling an experiment being added
         :param experiment: experiment which was added
         """
-        experiment.other_data_contexts = self.other_data_contexts   # make other data contexts available to newly added experiment
+        experiment.data_context_registry = self.data_context_registry   # make other data contexts available to newly added experiment
 
 
 class ExperimentViewModel(QObject, BaseContextAwareViewModel):
@@ -171,8 +213,16 @@ class ExperimentViewModel(QObject, BaseContextAwareViewModel):
         """
         if value < 0 or value >= len(self.experiments):
             return
+        experiment = self.experiments[value]
+        if isinstance(experiment, ClassDescriptor):     # experiments are only imported once they are selected
+            try:
+                experiment = ModuleManager.instance.load_class(experiment)
+            except Exception as e:
+                traceback.print_exc()
+                print('unable to load experiment "{}". Error: {}'.format(experiment.name, e))
+                return
         self._selected_experiment = value
-        self._experiment = self.experiments[value]
+        self._experiment = experiment
         self.notify_change('selected_experiment')
         self.notify_change('allow_run')
 
@@ -218,8 +268,19 @@ class ExperimentViewModel(QObject, BaseContextAwareViewModel):
         self.dialog_open = False
         self.dialog_answer = False
 
-        # initialize tools
-        self._tools = self.data_context_container
+    def update_experiments(self, experiments):
+        """
+        Replace the available experiments with the result of a new search (e.g. by the watcher of the experiment folder).
+        Nothing is published if the experiments are the same.
+        :param experiments: list of class descriptors
+        """
+        def key(experiment):
+            return experiment.class_name, experiment.module_name, experiment.path
+
+        if [key(experiment) for experiment in experiments] == [key(experiment) for experiment in self.experiments]:
+            return
+        self.experiments = list(experiments)
+        self.notify_change('available_experiments')
 
     def __del__(self):
         if self._running:
@@ -276,7 +337,7 @@ class ExperimentViewModel(QObject, BaseContextAwareViewModel):
         """
         Thread worker that initializes and runs the experiment (meant to be run in separate thread)
         """
-        instance = self._experiment(self._tools)    # create experiment
+        instance = self._experiment(self.data_context_container)    # create experiment (with the shared view of the tools)
         instance.calling_context = self     # use dependency injection to give experiment access to all tools
         self._running = True    # signal the start of the experiment
         self.notify_change('allow_run')
@@ -295,9 +356,7 @@ class ExperimentViewModel(QObject, BaseContextAwareViewModel):
             return
         self.experiments.clear()
         path = self.experiment_folder
-        experiment_classes = ModuleManager.instance.load_classes_from_folder_derived_from(path, BaseExperiment)
+        experiment_classes = ModuleManager.instance.find_classes_derived_from(path, BaseExperiment)   # BaseExperiment itself is not reported
 
         for cls in experiment_classes:
-            if is_non_strict_type(cls, BaseExperiment):     # do not add BaseExperiment
-                continue
             self.experiments.append(cls)
@@ -0,0 +1,76 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.ViewModels import BaseViewModel, ObservableProperty
+from QtModularUiPack.Framework import Instrumentation
+from PyQt5.QtCore import QTimer
+
+
+class InstrumentationViewModel(BaseViewModel):
+    """
+    Data context of the instrumentation frame. Shows the signals, bindings and notifications which took the most time.
+    """
+
+    name = 'instrumentation'
+
+    report = ObservableProperty('', doc='Gets the text report of the slowest signals, bindings and notifications')
+    top_count = ObservableProperty(20, doc='Gets the number of entries in the report')
+
+    @property
+    def enabled(self):
+        """
+        Gets whether the timings are recorded
+        """
+        return Instrumentation.instance.enabled
+
+    @enabled.setter
+    def enabled(self, value):
+        """
+        Sets whether the timings are recorded (recording slows the application down slightly)
+        :param value: True or False
+        """
+        Instrumentation.instance.enabled = value
+        if value:
+            self._timer.start()
+        else:
+            self._timer.stop()
+            self.refresh()
+        self.notify_change('enabled')
+
+    def __init__(self, refresh_interval=1000):
+        """
+        :param refresh_interval: time between report updates in milliseconds
+        """
+        super().__init__()
+        self._timer = QTimer()
+        self._timer.setInterval(refresh_interval)
+        self._timer.timeout.connect(self.refresh)
+        if Instrumentation.instance.enabled:
+            self._timer.start()
+        self.refresh()
+
+    def refresh(self):
+        """
+        Update the report
+        """
+        self.report = Instrumentation.instance.report(top=self.top_count)
+
+    def reset(self):
+        """
+        Drop all recorded timings
+        """
+        Instrumentation.instance.reset()
+        self.refresh()
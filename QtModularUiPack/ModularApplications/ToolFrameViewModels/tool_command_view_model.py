@@ -97,9 +97,6 @@ class ToolCommandViewModel(BaseContextAwareViewModel):
         self._off_thread_console_content = list()
         self.start_commands = ['import numpy as np', '# type "tools.help()" to see the tools you have currently access to.']
 
-        # initialize tools
-        self._tools = self.data_context_container
-
         # run start commands
         for command in self.start_commands:
             self.command = command
@@ -122,7 +119,7 @@ class ToolCommandViewModel(BaseContextAwareViewModel):
             sys.stderr = self._console_error
 
             # load local variables
-            tools = self._tools
+            tools = self.data_context_container
             local_variables = locals()
             for local in self._console_context:
                 if local != 'self' and local != 'tools' and local != 'local_variables':
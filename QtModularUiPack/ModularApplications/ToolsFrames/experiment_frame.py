@@ -47,6 +47,21 @@ class ExperimentFrame(EmptyFrame):
         """
         self.data_context.experiment_folder = value
 
+    @property
+    def watch_experiment_folder(self):
+        """
+        True if the experiment folder is watched for new, removed or renamed experiments
+        """
+        return self.data_context.watch_experiment_folder
+
+    @watch_experiment_folder.setter
+    def watch_experiment_folder(self, value):
+        """
+        Starts or stops watching the experiment folder
+        :param value: True or False
+        """
+        self.data_context.watch_experiment_folder = value
+
     def __init__(self, parent=None, experiment_folder=None, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.data_context = ExperimentOverviewViewModel(experiment_folder=experiment_folder)
@@ -121,7 +136,7 @@ class ExperimentBox(QFrame, BindingEnabledWidget):
         self._cannot_be_removed = cannot_be_removed
         self._experiment_selection = None
         self.data_context = ExperimentViewModel(experiment_folder=experiment_folder)    # add data context for the box
-        self.data_context.property_changed.connect(self._property_changed_)     # listen to property changes
+        self.data_context.connect_property('available_experiments', self._property_changed_)  # listen to changes of the experiment list
         self.data_context.widget = self     # dependency-injection
         self._layout = QGridLayout()
         self._layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
@@ -131,16 +146,23 @@ class ExperimentBox(QFrame, BindingEnabledWidget):
     def _property_changed_(self, name):
         if name == 'available_experiments':     # update collection of available experiments on the UI
             # retrieve currently selected experiment
-            experiment_name = self._experiment_selection.itemText(self.data_context.selected_experiment)
-
-            # remove all experiments from the list and add the new ones
-            self._experiment_selection.clear()
-            self._experiment_selection.addItems(self.data_context.available_experiments)
-
-            # check if the selected experiment is still present and select it if possible
-            idx = self._experiment_selection.findText(experiment_name)
-            if idx != -1:
-                self.data_context.selected_experiment = idx
+            selected = self.data_context.selected_experiment
+            experiment_name = self._experiment_selection.itemText(selected) if selected >= 0 else None
+
+            # remove all experiments from the list and add the new ones (refilling the box must not select and thereby
+            # import the first experiment)
+            was_blocked = self._experiment_selection.blockSignals(True)
+            try:
+                self._experiment_selection.clear()
+                self._experiment_selection.addItems(self.data_context.available_experiments)
+
+                # check if the selected experiment is still present and select it if possible
+                idx = self._experiment_selection.findText(experiment_name) if experiment_name is not None else -1
+                if idx != -1:
+                    self.data_context.selected_experiment = idx
+                self._experiment_selection.setCurrentIndex(idx)     # nothing is selected until the user picks one
+            finally:
+                self._experiment_selection.blockSignals(was_blocked)
 
     def message(self, message, title):
         """
@@ -0,0 +1,58 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Widgets import EmptyFrame
+from QtModularUiPack.ModularApplications.ToolFrameViewModels.instrumentation_view_model import InstrumentationViewModel
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QCheckBox, QLabel, QSpinBox, QPushButton, QTextEdit
+from PyQt5.QtGui import QFontDatabase
+
+
+class InstrumentationFrame(EmptyFrame):
+    """
+    This frame shows live where the GUI time goes: the signals, bindings and change notifications which took the most
+    time since the recording was enabled.
+    """
+
+    name = 'Instrumentation'
+
+    def __init__(self, parent=None, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs)
+        self.data_context = InstrumentationViewModel()
+        self._layout = QVBoxLayout()
+        self.setLayout(self._layout)
+        self._setup_()
+
+    def _setup_(self):
+        """
+        Generate UI
+        """
+        controls = QHBoxLayout()
+        controls.addWidget(self.add_widget(QCheckBox('record timings'), 'enabled', 'setChecked'))
+        controls.addStretch()
+        controls.addWidget(QLabel('entries'))
+        top_count = QSpinBox()
+        top_count.setRange(1, 1000)
+        controls.addWidget(self.add_widget(top_count, 'top_count', 'setValue'))
+        reset_button = QPushButton('reset')
+        reset_button.clicked.connect(self.data_context.reset)
+        controls.addWidget(reset_button)
+        self._layout.addLayout(controls)
+
+        report = QTextEdit()
+        report.setReadOnly(True)
+        report.setLineWrapMode(QTextEdit.NoWrap)
+        report.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self._layout.addWidget(self.add_widget(report, 'report', 'setPlainText'))
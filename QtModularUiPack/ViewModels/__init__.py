@@ -1,3 +1,6 @@
 from QtModularUiPack.ViewModels.base_view_model import BaseViewModel
+from QtModularUiPack.ViewModels.observable_property import ObservableProperty
+from QtModularUiPack.ViewModels.computed_property import ComputedProperty, computed
+from QtModularUiPack.ViewModels.data_context_registry import DataContextRegistry
 from QtModularUiPack.ViewModels.base_context_aware_view_model import BaseContextAwareViewModel
 from QtModularUiPack.ViewModels.modular_application_view_model import ModularApplicationViewModel
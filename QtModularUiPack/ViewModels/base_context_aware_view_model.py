@@ -14,8 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from QtModularUiPack.ViewModels import BaseViewModel
-from QtModularUiPack.Framework import ObservableList, is_non_strict_type, Signal
+from QtModularUiPack.ViewModels import BaseViewModel, DataContextRegistry
+from QtModularUiPack.ViewModels.data_context_registry import DataContexts
+from QtModularUiPack.Framework import ObservableList, Signal
+
+
+_EMPTY_DATA_CONTEXTS = DataContexts()  # view of view models without a registry
 
 
 class BaseContextAwareViewModel(BaseViewModel):
@@ -29,8 +33,11 @@ class BaseContextAwareViewModel(BaseViewModel):
     @property
     def other_data_contexts(self):
         """
-        Gets all the available data contexts
+        Gets all the available data contexts (an empty list with its own registry is created on first access if the view
+        model was not provided with the data contexts of an application)
         """
+        if self._other_data_contexts is None:
+            self.data_context_registry = DataContextRegistry(ObservableList())
         return self._other_data_contexts
 
     @other_data_contexts.setter
@@ -38,88 +45,100 @@ class BaseContextAwareViewModel(BaseViewModel):
         """
         Sets the data contexts of other view models. Makes view models available
         """
-        if type(self._other_data_contexts) == ObservableList:   # check if old data context list is observable
-            # de-register change events
-            self._other_data_contexts.item_added.disconnect(self._other_data_context_added_)
-            self._other_data_contexts.item_removed.disconnect(self._other_data_context_removed_)
+        if type(value) != ObservableList:
+            self.data_context_registry = None
+        elif self._data_context_registry is None or self._data_context_registry.data_contexts is not value:
+            self.data_context_registry = DataContextRegistry(value)     # the list is not indexed yet -> own registry
 
-        if type(value) == ObservableList:   # check if new data context list is observable
-            # register change events
-            self._other_data_contexts = value
-            self._other_data_contexts.item_added.connect(self._other_data_context_added_)
-            self._other_data_contexts.item_removed.connect(self._other_data_context_removed_)
+    @property
+    def data_context_container(self):
+        """
+        Gets the read-only view of the available data contexts by name (e.g. "tools.hello_world" in the console).
+        The view belongs to the registry and is shared by all view models using the same registry.
+        """
+        if self._data_context_registry is None:
+            return _EMPTY_DATA_CONTEXTS
+        return self._data_context_registry.view
+
+    @property
+    def data_context_registry(self):
+        """
+        Gets the registry which indexes the available data contexts (shared by all context aware view models of an application)
+        """
+        return self._data_context_registry
 
-            # add existing data contexts
-            for data_context in self._other_data_contexts:
-                self._other_data_context_added_(data_context)
+    @data_context_registry.setter
+    def data_context_registry(self, value: DataContextRegistry):
+        """
+        Sets the registry which indexes the available data contexts
+        :param value: registry (or None)
+        """
+        if value is self._data_context_registry:
+            return
+
+        if self._data_context_registry is not None:     # de-register change events and forget the old data contexts
+            self._data_context_registry.added.disconnect(self._other_data_context_added_)
+            self._data_context_registry.removed.disconnect(self._other_data_context_removed_)
+            self._data_context_registry.added_many.disconnect(self._other_data_contexts_added_)
+            self._data_context_registry.removed_many.disconnect(self._other_data_contexts_removed_)
+            removed = [(data_context, name) for name, data_context in self._data_context_registry.items()]
+            if removed:
+                self._other_data_contexts_removed_(removed)
+
+        self._data_context_registry = value
+        self._other_data_contexts = None
+        if value is not None:   # register change events and add the existing data contexts
+            self._other_data_contexts = value.data_contexts
+            value.added.connect(self._other_data_context_added_)
+            value.removed.connect(self._other_data_context_removed_)
+            value.added_many.connect(self._other_data_contexts_added_)
+            value.removed_many.connect(self._other_data_contexts_removed_)
+            added = [(data_context, name) for name, data_context in value.items()]
+            if added:
+                self._other_data_contexts_added_(added)
+        self._data_context_registry_changed_()
 
     def __init__(self):
         super().__init__()
         self.other_data_context_was_added = Signal(BaseViewModel)
         self.other_data_context_was_removed = Signal(BaseViewModel)
-        self.data_context_container = DataContexts()
-        self._other_data_contexts = None
-        self.other_data_contexts = ObservableList()
+        self.other_data_contexts_were_added = Signal(list)  # several view models at once (e.g. a restored layout)
+        self.other_data_contexts_were_removed = Signal(list)
+        self._other_data_contexts = None    # list of the registry (None until a registry is set or the list is read)
+        self._data_context_registry = None
 
-    def _count_instances_(self, data_context):
+    def _data_context_registry_changed_(self):
         """
-        Counts how many view models of this type are present
-        :param data_context: view model
-        :return: view model count
+        Called after a new registry (and list of data contexts) was set. Can be overwritten to pass it on.
         """
-        count = 0
-        for dc in self._other_data_contexts:
-            if is_non_strict_type(type(dc), type(data_context)):
-                count += 1
-        return count
+        pass
 
-    def _other_data_context_added_(self, data_context):
+    def _other_data_context_added_(self, data_context, name):
         """
-        Callback for handling newly added view model
+        Callback for handling newly added view model (the shared view was already updated by the registry)
         :param data_context: newly added view model
+        :param name: unique name of the view model
         """
-        count = self._count_instances_(data_context)
-        data_context_name = str(data_context).replace(' ', '')
-
-        if hasattr(data_context, 'name'):
-            data_context_name = getattr(data_context, 'name').replace(' ', '')
-
-        if count > 1:
-            data_context_name += str(count)
-        self.data_context_container.__dict__[data_context_name] = data_context
         self.other_data_context_was_added.emit(data_context)
 
-    def _other_data_context_removed_(self, data_context):
+    def _other_data_context_removed_(self, data_context, name):
         """
         Callback for handling the removal of a view model
         :param data_context: view model that has been removed
+        :param name: unique name of the view model
         """
-        remove_key = None
-        for key in self.data_context_container.__dict__:
-            if self.data_context_container.__dict__[key] == data_context:
-                remove_key = key
-                break
-        if remove_key is not None:
-            del self.data_context_container.__dict__[remove_key]
-            self.other_data_context_was_removed.emit(data_context)
-
-
-class DataContexts(object):
-    """
-    Data context container object for holding the data contexts
-    """
-
-    def help(self):
-        print('\nTools Command Line help:')
-        print('   Methods in tools:')
-        for method in dir(self):
-            if method[0:2] != '__' and method not in self.__dict__:
-                print('      {}(...)'.format(method))
+        self.other_data_context_was_removed.emit(data_context)
 
-        print('\n   Members of tools:')
-        for member in self.__dict__:
-            print('      {}'.format(member))
-        print('\n')
+    def _other_data_contexts_added_(self, added):
+        """
+        Callback for handling several view models which were added at once (e.g. when a saved layout is restored)
+        :param added: list of (view model, unique name)
+        """
+        self.other_data_contexts_were_added.emit([data_context for data_context, name in added])
 
-    def __init__(self):
-        pass
+    def _other_data_contexts_removed_(self, removed):
+        """
+        Callback for handling several view models which were removed at once
+        :param removed: list of (view model, unique name)
+        """
+        self.other_data_contexts_were_removed.emit([data_context for data_context, name in removed])
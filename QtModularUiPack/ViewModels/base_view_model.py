@@ -14,7 +14,12 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from QtModularUiPack.Framework import Signal
+from QtModularUiPack.Framework import Signal, GuiDispatcher
+from QtModularUiPack.Framework.Extensions.instrumentation import Instrumentation
+from PyQt5.QtCore import QTimer, QCoreApplication
+from contextlib import contextmanager
+from threading import Lock, get_ident
+from time import perf_counter
 
 
 class BaseViewModel(object):
@@ -25,14 +30,153 @@ class BaseViewModel(object):
     name = 'data_context'
 
     def __init__(self):
-        self.property_changed = Signal(str)
+        self.property_changed = Signal(str, name='{}.property_changed'.format(type(self).__name__))
+        self._property_signals = dict()     # dispatch table: property name -> signal of this property only
+        self._deferred_depths = dict()  # thread id -> nesting depth of the defer_notifications() blocks of this thread
+        self._held_changes = dict()     # thread id -> names held back by the defer block of a worker thread
+        self._pending_changes = dict()  # ordered set of property names which still have to be notified (GUI thread)
+        self._pending_lock = Lock()     # guards the pending changes handed over by worker threads
+        self._flush_scheduled = False
+        self.coalesce_notifications = False     # if true notifications are collected and sent on the next event loop iteration
+        self._computed_dependents = dict()  # property name -> states of the computed properties which depend on it
+
+    def connect_property(self, name, callback):
+        """
+        Connect a callback which is only notified if the given property changes
+        :param name: variable name
+        :param callback: callback function which receives the variable name
+        """
+        signal = self._property_signals.get(name)
+        if signal is None:
+            signal = Signal(str, name='{}.{}'.format(type(self).__name__, name))
+            self._property_signals[name] = signal
+        signal.connect(callback)
+
+    def disconnect_property(self, name, callback):
+        """
+        Disconnect a callback from the change notifications of the given property
+        :param name: variable name
+        :param callback: callback to disconnect
+        """
+        signal = self._property_signals.get(name)
+        if signal is not None:
+            signal.disconnect(callback)
+
+    @contextmanager
+    def defer_notifications(self):
+        """
+        Context manager which holds back all change notifications until the block is left.
+        Repeated notifications of the same variable are merged and sent once (the listeners read the latest value).
+        Blocks only hold back the notifications of their own thread, held back notifications of worker threads are
+        sent on the GUI thread (where an open block of the GUI thread holds them back as well).
+        """
+        ident = get_ident()
+        depth = self._deferred_depths.get(ident, 0)     # every thread only changes its own entry
+        self._deferred_depths[ident] = depth + 1
+        if depth == 0 and not GuiDispatcher.instance.is_gui_thread():
+            self._held_changes[ident] = dict()
+        try:
+            yield self
+        finally:
+            if depth > 0:
+                self._deferred_depths[ident] = depth
+            else:
+                del self._deferred_depths[ident]
+                held = self._held_changes.pop(ident, None)
+                if held is None:    # GUI thread
+                    self.flush_notifications()
+                elif held:
+                    with self._pending_lock:
+                        self._pending_changes.update(held)
+                    self.flush_notifications()  # posted to the GUI thread
+
+    def flush_notifications(self):
+        """
+        Send all change notifications that have been held back (on the GUI thread, once its defer block is left)
+        """
+        dispatcher = GuiDispatcher.instance
+        if not dispatcher.is_gui_thread():  # widgets must only be updated from the GUI thread
+            dispatcher.post(self.flush_notifications, key=(id(self), '__flush__'))
+            return
+        if self._deferred_depths and self._deferred_depths.get(get_ident()):
+            return  # the defer block of the GUI thread flushes everything when it is left
+
+        self._flush_scheduled = False
+        while self._pending_changes:
+            with self._pending_lock:
+                pending = self._pending_changes
+                self._pending_changes = dict()  # listeners may cause new notifications while being notified
+            for name in pending:
+                self._send_change_(name)
 
     def notify_change(self, name):
         """
-        Send notification that a variable has been changed that the binding enabled widgets can update accordingly
+        Send notification that a variable has been changed that the binding enabled widgets can update accordingly.
+        Notifications sent from other threads are delivered on the GUI thread (merged with pending ones of the same name).
+        :param name: variable name
+        """
+        dependents = self._computed_dependents.get(name)
+        # cached values are dropped right away, reads before the notification is delivered are up to date
+        dropped = [state for state in list(dependents) if state.drop(self)] if dependents else ()
+        self._deliver_change_(name)
+        for state in dropped:   # the computed properties change after the property they depend on
+            self.notify_change(state.name)
+
+    def _deliver_change_(self, name):
+        """
+        Send, hold back or marshal a change notification depending on the calling thread and the notification mode
+        :param name: variable name
+        """
+        dispatcher = GuiDispatcher.instance
+        if not dispatcher.is_gui_thread():  # widgets must only be updated from the GUI thread
+            held = self._held_changes.get(get_ident()) if self._held_changes else None
+            if held is not None:    # hold notification back until the defer block of this thread is left
+                held[name] = None
+            else:
+                dispatcher.post(self._deliver_change_, name, key=(id(self), name))
+        elif self._deferred_depths and self._deferred_depths.get(get_ident()):  # hold back until the block is left
+            with self._pending_lock:
+                self._pending_changes[name] = None
+        elif self.coalesce_notifications and QCoreApplication.instance() is not None:
+            with self._pending_lock:
+                self._pending_changes[name] = None
+            if not self._flush_scheduled:   # flush once as soon as the event loop is idle again
+                self._flush_scheduled = True
+                QTimer.singleShot(0, self.flush_notifications)
+        else:
+            self._send_change_(name)
+
+    def _send_change_(self, name):
+        """
+        Notify all listeners about a changed variable
         :param name: variable name
         """
         self.property_changed.emit(name)
+        signal = self._property_signals.get(name)   # only reach the listeners of this property
+        if signal is not None:
+            signal.emit(name)
+
+    def _send_change_instrumented_(self, name):
+        """
+        Notify all listeners about a changed variable and record the time it took (used while instrumentation is enabled)
+        :param name: variable name
+        """
+        start = perf_counter()
+        BaseViewModel._send_change_plain_(self, name)
+        Instrumentation.instance.record('notify', '{}.{}'.format(type(self).__name__, name), perf_counter() - start)
+
+    _send_change_plain_ = _send_change_
+
+    @staticmethod
+    def _set_instrumented_(enabled):
+        """
+        Exchange the notification code path when the instrumentation is enabled or disabled
+        :param enabled: True or False
+        """
+        if enabled:
+            BaseViewModel._send_change_ = BaseViewModel._send_change_instrumented_
+        else:
+            BaseViewModel._send_change_ = BaseViewModel._send_change_plain_
 
     def save_configuration(self):
         """
@@ -42,3 +186,6 @@ class BaseViewModel(object):
         NOTE: There is now save system in place, this method will just by called once the application terminates
         """
         pass
+
+
+Instrumentation.instance.add_switch(BaseViewModel._set_instrumented_)
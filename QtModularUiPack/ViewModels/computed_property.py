@@ -0,0 +1,165 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from types import MethodType
+
+
+class _DependencyRecorder(object):
+    """
+    Stands in for the view model while a computed property is evaluated and records which members are read.
+    Reading a backing field "_name" is recorded as a dependency on the property "name".
+    """
+
+    __slots__ = ('_instance', '_dependencies')
+
+    def __init__(self, instance):
+        self._instance = instance
+        self._dependencies = set()
+
+    def __getattr__(self, name):
+        value = getattr(self._instance, name)
+        if isinstance(value, MethodType) and value.__self__ is self._instance:
+            return MethodType(value.__func__, self)     # keep recording inside helper methods
+        self._dependencies.add(name[1:] if name[0] == '_' else name)
+        return value
+
+    def __setattr__(self, name, value):
+        if name in _DependencyRecorder.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._instance, name, value)
+
+
+class _ComputedState(object):
+    """
+    Cached value and dependencies of a computed property of one view model instance
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.valid = False
+        self.value = None
+        self.dependencies = set()
+
+    def invalidate(self, instance):
+        """
+        Drop the cached value and notify the change of the computed property
+        :param instance: view model
+        """
+        if self.drop(instance):
+            instance.notify_change(self.name)
+
+    def drop(self, instance):
+        """
+        Drop the cached value (without notification)
+        :param instance: view model
+        :return: True if there was a cached value
+        """
+        if not self.valid:
+            return False
+        self.valid = False
+        self.value = None
+        self.disconnect(instance)
+        return True
+
+    def connect(self, instance, dependencies):
+        """
+        Register the state with the properties it depends on (they invalidate it as soon as they change)
+        :param instance: view model
+        :param dependencies: names of the properties
+        """
+        self.dependencies = dependencies
+        for dependency in dependencies:
+            instance._computed_dependents.setdefault(dependency, set()).add(self)
+
+    def disconnect(self, instance):
+        """
+        Stop depending on the properties
+        :param instance: view model
+        """
+        for dependency in self.dependencies:
+            dependents = instance._computed_dependents.get(dependency)
+            if dependents is not None:
+                dependents.discard(self)
+        self.dependencies = set()
+
+
+class ComputedProperty(object):
+    """
+    Read-only view model property whose value is cached.
+    While the getter runs, all properties it reads are recorded. The cached value is dropped and a change notification
+    is sent as soon as one of these properties notifies a change (right away, also if the notification itself is held
+    back or delivered later on the GUI thread). The value is computed again on the next read.
+    """
+
+    def __init__(self, func):
+        self._func = func
+        self.__doc__ = func.__doc__
+        self.name = func.__name__
+        self._state_attribute = '_computed_' + self.name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self._state_attribute = '_computed_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        state = instance.__dict__.get(self._state_attribute)
+        if state is None:
+            state = _ComputedState(self.name)
+            instance.__dict__[self._state_attribute] = state
+        elif state.valid:
+            return state.value
+
+        recorder = _DependencyRecorder(instance)
+        value = self._func(recorder)
+        dependencies = recorder._dependencies
+        dependencies.discard(self.name)
+        state.connect(instance, dependencies)
+        state.value = value
+        state.valid = True
+        return value
+
+    def __set__(self, instance, value):
+        raise AttributeError('computed property "{}" cannot be set'.format(self.name))
+
+    def invalidate(self, instance):
+        """
+        Drop the cached value of an instance manually (e.g. if the getter depends on data that does not notify changes)
+        :param instance: view model
+        """
+        state = instance.__dict__.get(self._state_attribute)
+        if state is not None:
+            state.invalidate(instance)
+
+
+def computed(func):
+    """
+    Decorator to declare a cached, dependency tracked property on a view model.
+
+    Example:
+        class MyViewModel(BaseViewModel):
+            spectrum = ObservableProperty()
+
+            @computed
+            def power(self):
+                return np.abs(self.spectrum) ** 2
+    :param func: getter of the property
+    :return: computed property
+    """
+    return ComputedProperty(func)
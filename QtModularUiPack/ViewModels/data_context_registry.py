@@ -0,0 +1,286 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework import ObservableList, Signal
+from heapq import heappush, heappop
+
+
+def data_context_base_name(data_context):
+    """
+    Returns the name under which a data context is accessible (without the number of the instance)
+    :param data_context: view model
+    :return: name
+    """
+    if hasattr(data_context, 'name'):
+        return getattr(data_context, 'name').replace(' ', '')
+    return str(data_context).replace(' ', '')
+
+
+class DataContexts(object):
+    """
+    Read-only data context container which makes the data contexts accessible by name (e.g. "tools.hello_world").
+    It is maintained by a data context registry, the version increases with every change.
+    """
+
+    __slots__ = ('__dict__', '_version')    # the version is kept out of the members (which are the data contexts)
+
+    @property
+    def version(self):
+        """
+        Gets the number of changes of the data contexts
+        """
+        return self._version
+
+    def help(self):
+        print('\nTools Command Line help:')
+        print('   Methods in tools:')
+        for method in dir(self):
+            if method[0] != '_' and method not in self.__dict__ and callable(getattr(type(self), method, None)):
+                print('      {}(...)'.format(method))
+
+        print('\n   Members of tools:')
+        for member in self.__dict__:
+            print('      {}'.format(member))
+        print('\n')
+
+    def __init__(self):
+        object.__setattr__(self, '_version', 0)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('the data contexts are read-only (add the view model to the application instead)')
+
+    def __delattr__(self, name):
+        raise AttributeError('the data contexts are read-only (remove the view model from the application instead)')
+
+
+class DataContextRegistry(object):
+    """
+    Index of the data contexts of an application. It follows an observable list of data contexts and assigns every data
+    context a unique name ("<name>" for the first instance, "<name>2", "<name>3", ... for further ones, numbers whose
+    name is taken by a data context with another name are skipped).
+    A name does not change while the data context is present; names of removed data contexts are reused (lowest first).
+    Adding, removing and looking up data contexts does not depend on the number of data contexts.
+    Single changes are announced through added and removed, changes of several data contexts at once (ranges and
+    resets of the list, e.g. a restored layout) through one added_many or removed_many notification.
+    The registry maintains one read-only DataContexts view which is shared by all its users.
+    """
+
+    @property
+    def view(self):
+        """
+        Gets the read-only view of the data contexts by name
+        """
+        return self._view
+
+    @property
+    def version(self):
+        """
+        Gets the number of changes of the registered data contexts
+        """
+        return self._view.version
+
+    @property
+    def data_contexts(self):
+        """
+        Gets the observable list of data contexts the registry follows
+        """
+        return self._data_contexts
+
+    def __init__(self, data_contexts: ObservableList = None):
+        """
+        :param data_contexts: (Optional) observable list of data contexts (an empty list is created if not given)
+        """
+        self.added = Signal(object, str)    # data context, name
+        self.removed = Signal(object, str)  # data context, name
+        self.added_many = Signal(list)  # list of (data context, name)
+        self.removed_many = Signal(list)    # list of (data context, name)
+        self._names = dict()    # id of data context -> (name, base name, instance number)
+        self._by_name = dict()  # name -> data context
+        self._by_type = dict()  # type name -> {id of data context: data context}
+        self._next_number = dict()  # base name -> next unused instance number
+        self._free_numbers = dict()     # base name -> heap of released instance numbers
+        self._view = DataContexts()
+        self._data_contexts = data_contexts if data_contexts is not None else ObservableList()
+        self._data_contexts.items_inserted.connect(self._on_inserted_)
+        self._data_contexts.items_removed.connect(self._on_removed_)
+        self._data_contexts.items_reset.connect(self._on_reset_)
+        self._add_all_(self._data_contexts)
+
+    def __contains__(self, data_context):
+        return id(data_context) in self._names
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(list(self._by_name.values()))
+
+    def name_of(self, data_context):
+        """
+        Returns the name of a data context (or None if it is not registered)
+        :param data_context: view model
+        :return: name
+        """
+        entry = self._names.get(id(data_context))
+        return entry[0] if entry is not None else None
+
+    def get(self, name, default=None):
+        """
+        Returns the data context with the given name
+        :param name: name
+        :param default: value returned if there is no data context with this name
+        :return: view model
+        """
+        return self._by_name.get(name, default)
+
+    def items(self):
+        """
+        Returns the (name, data context) pairs of all registered data contexts
+        """
+        return list(self._by_name.items())
+
+    def of_type(self, data_context_type):
+        """
+        Returns all data contexts of a type
+        :param data_context_type: type or type name
+        :return: list of view models
+        """
+        type_name = data_context_type if isinstance(data_context_type, str) else data_context_type.__name__
+        return list(self._by_type.get(type_name, dict()).values())
+
+    def _add_(self, data_context):
+        """
+        Register a data context and assign its name (without announcing it)
+        :param data_context: view model
+        :return: name (None if the data context was already registered)
+        """
+        key = id(data_context)
+        if key in self._names:
+            return None
+
+        base_name = data_context_base_name(data_context)
+        free_numbers = self._free_numbers.setdefault(base_name, list())
+        skipped = list()
+        while True:
+            if free_numbers:
+                number = heappop(free_numbers)
+            else:
+                number = self._next_number.get(base_name, 1)
+                self._next_number[base_name] = number + 1
+            name = base_name if number == 1 else base_name + str(number)
+            if name not in self._by_name:
+                break
+            skipped.append(number)  # name is taken by a data context with another base name (e.g. "t2")
+        for number_in_use in skipped:
+            heappush(free_numbers, number_in_use)   # can be used once the other data context is gone
+
+        self._names[key] = (name, base_name, number)
+        self._by_name[name] = data_context
+        self._view.__dict__[name] = data_context
+        self._increase_version_()
+        self._by_type.setdefault(type(data_context).__name__, dict())[key] = data_context
+        return name
+
+    def _remove_(self, data_context):
+        """
+        Unregister a data context and release its name (without announcing it)
+        :param data_context: view model
+        :return: name (None if the data context was not registered)
+        """
+        key = id(data_context)
+        entry = self._names.pop(key, None)
+        if entry is None:
+            return None
+        name, base_name, number = entry
+
+        del self._by_name[name]
+        del self._view.__dict__[name]
+        self._increase_version_()
+        type_name = type(data_context).__name__
+        of_type = self._by_type[type_name]
+        del of_type[key]
+        if not of_type:
+            del self._by_type[type_name]
+
+        heappush(self._free_numbers.setdefault(base_name, list()), number)
+        return name
+
+    def _increase_version_(self):
+        """
+        Count a change of the data contexts
+        """
+        object.__setattr__(self._view, '_version', self._view.version + 1)
+
+    def _announce_(self, changes, single, many):
+        """
+        Announce registered or unregistered data contexts with one notification
+        :param changes: list of (data context, name)
+        :param single: signal for a single data context
+        :param many: signal for several data contexts
+        """
+        if len(changes) == 1:
+            single.emit(*changes[0])
+        elif changes:
+            many.emit(changes)
+
+    def _add_all_(self, data_contexts):
+        """
+        Register data contexts and announce them at once
+        :param data_contexts: view models
+        """
+        added = list()
+        for data_context in data_contexts:
+            name = self._add_(data_context)
+            if name is not None:
+                added.append((data_context, name))
+        self._announce_(added, self.added, self.added_many)
+
+    def _remove_all_(self, data_contexts):
+        """
+        Unregister data contexts and announce them at once
+        :param data_contexts: view models
+        """
+        removed = list()
+        for data_context in data_contexts:
+            name = self._remove_(data_context)
+            if name is not None:
+                removed.append((data_context, name))
+        self._announce_(removed, self.removed, self.removed_many)
+
+    def _on_inserted_(self, start, data_contexts):
+        """
+        Callback for data contexts which were inserted into the list
+        :param start: index of the first inserted data context
+        :param data_contexts: inserted data contexts
+        """
+        self._add_all_(data_contexts)
+
+    def _on_removed_(self, start, data_contexts):
+        """
+        Callback for data contexts which were removed from the list
+        :param start: index of the first removed data context
+        :param data_contexts: removed data contexts
+        """
+        self._remove_all_(data_contexts)
+
+    def _on_reset_(self):
+        """
+        Callback for changes of the list that are not described by a range (e.g. batch updates)
+        """
+        present = set(id(data_context) for data_context in self._data_contexts)
+        # release the names of data contexts which are gone first
+        self._remove_all_([data_context for data_context in self._by_name.values() if id(data_context) not in present])
+        self._add_all_(self._data_contexts)
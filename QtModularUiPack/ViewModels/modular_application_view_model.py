@@ -14,7 +14,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from QtModularUiPack.ViewModels import BaseViewModel, BaseContextAwareViewModel
+from QtModularUiPack.ViewModels import BaseViewModel, BaseContextAwareViewModel, DataContextRegistry
 from QtModularUiPack.Framework import ObservableList
 
 
@@ -27,6 +27,7 @@ class ModularApplicationViewModel(BaseViewModel):
         super().__init__()
         self.context_aware_view_models = ObservableList()
         self.other_data_contexts = ObservableList()  # filled via dependency injection
+        self.data_context_registry = DataContextRegistry(self.other_data_contexts)   # index shared by all context aware view models
 
     def connect_context_aware_view_model(self, context_aware_vm: BaseContextAwareViewModel):
         """
@@ -34,14 +35,14 @@ class ModularApplicationViewModel(BaseViewModel):
         :param context_aware_vm: context aware view model
         """
         self.context_aware_view_models.append(context_aware_vm)
-        context_aware_vm.other_data_contexts = self.other_data_contexts
+        context_aware_vm.data_context_registry = self.data_context_registry
 
     def disconnect_context_aware_view_model(self, context_aware_vm: BaseContextAwareViewModel):
         """
         Remove the context aware view model from the event system
         :param context_aware_vm: context aware view model to be removed
         """
-        context_aware_vm.other_data_contexts = None
+        context_aware_vm.data_context_registry = None
         if context_aware_vm in self.context_aware_view_models:
             self.context_aware_view_models.remove(context_aware_vm)
 
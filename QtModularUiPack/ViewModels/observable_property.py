@@ -0,0 +1,142 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from operator import attrgetter
+from copy import deepcopy
+import numpy as np
+
+
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, frozenset, range)   # shared defaults are safe
+
+
+def values_equal(old, new):
+    """
+    Compare two values without failing on types whose comparison does not return a boolean
+    :param old: previous value
+    :param new: new value
+    :return: True if the values are considered equal
+    """
+    if old is new:
+        return True
+    try:
+        return bool(old == new)
+    except (ValueError, TypeError):     # e.g. numpy arrays -> treat as changed
+        return False
+
+
+def arrays_equal(old, new):
+    """
+    NumPy-aware comparison of two values (compares arrays element-wise)
+    :param old: previous value
+    :param new: new value
+    :return: True if the values are considered equal
+    """
+    if old is new:
+        return True
+    try:
+        return bool(np.array_equal(old, new))
+    except (ValueError, TypeError):
+        return False
+
+
+class _InstanceDefault(object):
+    """
+    Class level default of an observable property which gives every instance its own value on first access.
+    As a non-data descriptor it is shadowed by the value stored in the instance afterwards.
+    """
+
+    __slots__ = ('_attribute', '_factory')
+
+    def __init__(self, attribute, factory):
+        """
+        :param attribute: name of the member holding the value ("_<name>")
+        :param factory: function creating the default value of an instance
+        """
+        self._attribute = attribute
+        self._factory = factory
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self._factory()
+        instance.__dict__[self._attribute] = value
+        return value
+
+
+class ObservableProperty(property):
+    """
+    Declarative replacement for the @property getter/setter pair of a view model which calls notify_change().
+    The value is stored in the instance as "_<name>" (the same member a hand-written property would use) and the
+    notification is skipped if the new value equals the old one.
+    Mutable defaults (e.g. lists, dicts or arrays) are copied for every instance instead of being shared.
+
+    Example:
+        class MyViewModel(BaseViewModel):
+            upper_text = ObservableProperty('Hello World!')
+            selected_items = ObservableProperty(default_factory=list)
+    """
+
+    def __init__(self, default=None, doc=None, compare=True, numpy_aware=False, default_factory=None):
+        """
+        :param default: value returned before the property was set the first time (mutable values are deep-copied)
+        :param doc: documentation of the property
+        :param compare: if set to false every assignment sends a notification
+        :param numpy_aware: compare values with numpy.array_equal (use this for properties holding arrays)
+        :param default_factory: (Optional) function creating the default value of every instance (replaces default)
+        """
+        super().__init__()
+        if default_factory is not None and default is not None:
+            raise ValueError('Either a default or a default factory can be given, not both.')
+        self.doc = doc
+        self.default = default
+        self.default_factory = default_factory
+        self.compare = compare
+        self.numpy_aware = numpy_aware
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        """
+        Builds the getter and setter once the name of the property is known
+        """
+        self.name = name
+        attribute = '_' + name
+        if attribute not in owner.__dict__:
+            factory = self.default_factory
+            if factory is None and not isinstance(self.default, _IMMUTABLE_TYPES):
+                default = self.default
+                factory = lambda: deepcopy(default)     # a mutable default must not be shared by the instances
+            if factory is None:
+                setattr(owner, attribute, self.default)     # class level default -> instances without a value fall back to it
+            else:
+                setattr(owner, attribute, _InstanceDefault(attribute, factory))
+        getter = attrgetter(attribute)
+
+        if not self.compare:
+            def setter(instance, value):
+                setattr(instance, attribute, value)
+                instance.notify_change(name)
+        else:
+            equals = arrays_equal if self.numpy_aware else values_equal
+
+            def setter(instance, value):
+                if equals(getattr(instance, attribute), value):
+                    return  # nothing changed -> no notification
+                setattr(instance, attribute, value)
+                instance.notify_change(name)
+
+        # re-initialize the underlying property with the generated functions (keeps the C-level attribute access)
+        property.__init__(self, getter, setter, None, self.doc)
+        self.__doc__ = self.doc
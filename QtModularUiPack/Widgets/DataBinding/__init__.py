@@ -1 +1,2 @@
 from .bindings import Binding, BindingEnabledWidget, BindingManager
+from .observable_list_model import ObservableListModel
@@ -15,7 +15,29 @@ limitations under the License.
 """
 
 from QtModularUiPack.Framework import Signal
+from QtModularUiPack.Framework.Extensions import Singleton, Instrumentation
 from QtModularUiPack.ViewModels import BaseViewModel
+from PyQt5.QtCore import QTimer, QCoreApplication
+from operator import attrgetter
+from time import perf_counter
+from itertools import count
+import heapq
+import math
+
+
+_instrumented = False   # true while the instrumentation is enabled (checked on every widget update)
+
+
+def _set_instrumented(enabled):
+    """
+    Switch the time recording of widget updates on or off
+    :param enabled: True or False
+    """
+    global _instrumented
+    _instrumented = enabled
+
+
+Instrumentation.instance.add_switch(_set_instrumented)
 
 
 class BindingEnabledWidget(object):
@@ -61,7 +83,9 @@ class BindingManager(object):
     """
 
     def __init__(self, data_context):
-        self._bindings = list()
+        self._bindings = dict()     # index: (widget id, attribute setter) -> binding
+        self._bindings_by_variable = dict()     # index: variable name -> bindings listening to that variable
+        self._members = None    # members of the data context (computed once when the first binding is set)
         self._vm = data_context
 
     def destroy(self):
@@ -69,27 +93,35 @@ class BindingManager(object):
         Remove all bindings and remove the listeners from the view model.
         IMPORTANT: This has to be made prior to destruction to prevent memory leaks.
         """
-        for binding in self._bindings:
+        for binding in self._bindings.values():
             binding.remove()
+        self._bindings.clear()
+        self._bindings_by_variable.clear()
+        self._members = None
 
-    def set_binding(self, variable_name, widget, widget_attribute_setter, operation=None, inv_op=None):
+    def set_binding(self, variable_name, widget, widget_attribute_setter, operation=None, inv_op=None, max_rate_hz=None):
         """
         Set binding between a variable in the data context and a widget attribute.
         :param variable_name: name of variable in the data context to bind to
         :param widget: the widget which should be updated if the data context changes
         :param widget_attribute_setter: the attribute of the widget which should be updated
         :param operation: (Optional) an expression that process the value can be added (e.g. lambda x: not x -> inverted value gets propagated to widget)
+        :param max_rate_hz: (Optional) maximum number of widget updates per second (the latest value is always delivered),
+                            has to be greater than zero
         """
         if self._vm is None:    # do nothing if no data context is present
             return
 
-        members = dir(self._vm)
-        if variable_name in members:    # check if the variable name can be found in the data context
-            existing_binding = self.get_binding(widget, widget_attribute_setter)    # check if the binding already exists
+        if self._has_member_(variable_name):    # check if the variable name can be found in the data context
+            existing_binding = self._bindings.get((id(widget), widget_attribute_setter))    # check if the binding already exists
             if existing_binding is None:    # create a new binding
-                self._bindings.append(Binding(variable_name, widget, widget_attribute_setter, self._vm, operation, inv_op))
-            else:   # update existing binding
+                binding = Binding(variable_name, widget, widget_attribute_setter, self._vm, operation, inv_op, max_rate_hz)
+                self._bindings[(id(widget), widget_attribute_setter)] = binding
+                self._bindings_by_variable.setdefault(variable_name, list()).append(binding)
+            elif existing_binding.variable_name != variable_name:   # update existing binding
+                self._bindings_by_variable[existing_binding.variable_name].remove(existing_binding)
                 existing_binding.variable_name = variable_name
+                self._bindings_by_variable.setdefault(variable_name, list()).append(existing_binding)
 
     def get_binding(self, widget, widget_attribute):
         """
@@ -101,10 +133,25 @@ class BindingManager(object):
         if self._vm is None:
             return
 
-        for binding in self._bindings:
-            if binding.widget == widget and binding.widget_attribute_setter == widget_attribute:
-                return binding
-        return None
+        return self._bindings.get((id(widget), widget_attribute))
+
+    def get_bindings(self, variable_name):
+        """
+        Returns all bindings that listen to a given variable of the data context
+        :param variable_name: name of the variable in the data context
+        :return: list of bindings
+        """
+        return list(self._bindings_by_variable.get(variable_name, list()))
+
+    def _has_member_(self, variable_name):
+        """
+        Checks if the data context has a given member. The members are only re-read if the name is not known yet.
+        :param variable_name: name of the member
+        :return: True or False
+        """
+        if self._members is None or variable_name not in self._members:
+            self._members = set(dir(self._vm))  # (re-)read members, attributes might have been added since the last read
+        return variable_name in self._members
 
 
 def cast_float(text):
@@ -137,12 +184,111 @@ def cast_int(text):
             return int(text)    # normal conversion
 
 
+@Singleton
+class BindingScheduler(object):
+    """
+    Shared timer which delivers the held back updates of all rate limited bindings.
+    """
+
+    def __init__(self):
+        self._pending = dict()  # binding -> time at which the binding may update its widget again
+        self._due_times = list()    # heap of (due time, sequence number, binding), may contain cancelled entries
+        self._sequence = count()    # orders entries with equal due times (bindings are not comparable)
+        self._timer = None
+
+    def schedule(self, binding, due_time):
+        """
+        Schedule the delivery of the latest value of a rate limited binding
+        :param binding: binding which has a pending update
+        :param due_time: time (perf_counter) at which the update should be delivered
+        """
+        if QCoreApplication.instance() is None:     # no event loop -> deliver right away
+            binding._deliver_pending_()
+            return
+
+        self._pending[binding] = due_time
+        heapq.heappush(self._due_times, (due_time, next(self._sequence), binding))
+        if self._due_times[0][2] is binding or not self._timer_active_():  # only an earlier update moves the timer
+            self._restart_timer_()
+
+    def cancel(self, binding):
+        """
+        Remove a pending update of a binding (e.g. if the binding is removed)
+        :param binding: binding
+        """
+        self._pending.pop(binding, None)   # the heap entry is skipped when it comes up
+
+    def _timer_active_(self):
+        """
+        Returns true if the timer is waiting for a pending update
+        """
+        return self._timer is not None and self._timer.isActive()
+
+    def _discard_cancelled_(self):
+        """
+        Remove the entries of cancelled or rescheduled updates from the top of the heap
+        """
+        due_times = self._due_times
+        pending = self._pending
+        while due_times and pending.get(due_times[0][2]) != due_times[0][0]:
+            heapq.heappop(due_times)
+
+    def _restart_timer_(self):
+        """
+        Start the timer such that it fires when the earliest pending update is due
+        """
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._on_timeout_)
+
+        self._discard_cancelled_()
+        if self._due_times:
+            delay = max(0.0, self._due_times[0][0] - perf_counter())
+            self._timer.start(int(math.ceil(delay * 1000)))
+        else:
+            self._timer.stop()
+
+    def _on_timeout_(self):
+        """
+        Deliver all updates that are due
+        """
+        now = perf_counter()
+        due_times = self._due_times
+        self._discard_cancelled_()
+        while due_times and due_times[0][0] <= now:
+            due_time, sequence, binding = heapq.heappop(due_times)
+            del self._pending[binding]
+            binding._deliver_pending_()
+            self._discard_cancelled_()
+        self._restart_timer_()
+
+
 class Binding(object):
     """
     A binding is used to bind a variable from a data context to the attribute of a widget.
     The binding will automatically propagate changes made in the data context to the widget and in some cases vice versa.
     """
 
+    @property
+    def variable_name(self):
+        """
+        Gets the name of the variable in the data context this binding listens to
+        """
+        return self._variable_name
+
+    @variable_name.setter
+    def variable_name(self, value):
+        """
+        Sets the name of the variable in the data context this binding listens to
+        :param value: variable name
+        """
+        if self._variable_name is not None:
+            self._vm.disconnect_property(self._variable_name, self._listener_)    # stop listening to the old variable
+        self._variable_name = value
+        self._get_value_ = attrgetter(value)    # resolve the getter of the variable once
+        self._vm.connect_property(value, self._listener_)  # only get notified about changes of this variable
+
     def _on_change_(self, name):
         """
         Callback to handle change notifications from the data context. Update widget if necessary.
@@ -150,16 +296,68 @@ class Binding(object):
         """
         if not self._locked_during_update:
             self._locked_during_update = True
-            if name == self.variable_name:  # check if this bindings variable was changed
-                setter = getattr(self.widget, self.widget_attribute_setter)     # get the setter of the widget attribute
-                value = getattr(self._vm, self.variable_name)   # get the value of the variable
+            if _instrumented:
+                start = perf_counter()
+                self._update_widget_(self._get_value_(self._vm))
+                Instrumentation.instance.record('binding', self._describe_(), perf_counter() - start)
+            else:
+                self._update_widget_(self._get_value_(self._vm))    # (operation and) setter were resolved in advance
+            self._locked_during_update = False
+
+    def _describe_(self):
+        """
+        Returns a description of the binding for instrumentation reports
+        """
+        return '{}.{} -> {}.{}'.format(type(self._vm).__name__, self._variable_name, type(self.widget).__name__,
+                                       self.widget_attribute_setter)
 
-                # if an operation was specified for this binding, apply it to the retrieved value
-                if self.operation is not None:
-                    value = self.operation(value)
+    def _on_change_rate_limited_(self, name):
+        """
+        Callback to handle change notifications if the binding has a maximum update rate.
+        Updates that arrive too early are held back and merged such that only the latest value is delivered.
+        :param name: name of the changed variable
+        """
+        if self._update_pending:
+            self.updates_dropped += 1   # the pending update will deliver the latest value instead
+            return
 
-                setter(value)   # set the widget attribute to the new value
-            self._locked_during_update = False
+        now = perf_counter()
+        due_time = self._last_update_time + self._min_update_interval
+        if now >= due_time:
+            self._deliver_(now)
+        else:
+            self._update_pending = True
+            BindingScheduler.instance.schedule(self, due_time)
+
+    def _deliver_pending_(self):
+        """
+        Deliver an update which was held back by the rate limit
+        """
+        self._update_pending = False
+        self._deliver_(perf_counter())
+
+    def _deliver_(self, now):
+        """
+        Update the widget of a rate limited binding
+        :param now: current time (perf_counter)
+        """
+        self._last_update_time = now
+        self.updates_delivered += 1
+        self._on_change_(self._variable_name)
+
+    def _resolve_widget_update_(self):
+        """
+        Resolve the setter of the widget attribute and fuse it with the operation into a single callable.
+        Has to be called again if the widget, the setter or the operation of the binding are replaced.
+        """
+        setter = getattr(self.widget, self.widget_attribute_setter)     # get the setter of the widget attribute
+        operation = self.operation
+        if operation is None:
+            self._update_widget_ = setter
+        else:   # if an operation was specified for this binding, apply it to the retrieved value
+            def update_widget(value):
+                setter(operation(value))
+            self._update_widget_ = update_widget
 
     def _back_to_source_text_(self, text=None):
         """
@@ -266,7 +464,10 @@ class Binding(object):
         Removes listener from data context.
         IMPORTANT: Has to be called prior to binding removal.
         """
-        self._vm.property_changed.disconnect(self._on_change_)
+        self._vm.disconnect_property(self._variable_name, self._listener_)
+        if self._update_pending:
+            BindingScheduler.instance.cancel(self)
+            self._update_pending = False
 
     def _setup_source_target_type_casting_(self):
         """
@@ -277,26 +478,41 @@ class Binding(object):
             if (type(value) == int or type(value) == float) and self.widget_attribute_setter == 'setText':
                 cast = cast_int if type(value) == int else cast_float
 
-                if self.inv_op is not None:
-                    self.inv_op = lambda v: self.inv_op(cast(v))
+                inv_op = self.inv_op
+                if inv_op is not None:
+                    self.inv_op = lambda v: inv_op(cast(v))
                 else:
                     self.inv_op = cast
 
-                if self.operation is not None:
-                    self.operation = lambda v: str(self.operation(v))
+                operation = self.operation
+                if operation is not None:
+                    self.operation = lambda v: str(operation(v))
                 else:
-                    self.operation = lambda v: str(v)
+                    self.operation = str
 
-    def __init__(self, variable_name, widget, widget_attribute_setter, data_context, operation=None, inv_op=None):
+    def __init__(self, variable_name, widget, widget_attribute_setter, data_context, operation=None, inv_op=None, max_rate_hz=None):
+        if max_rate_hz is not None and not max_rate_hz > 0:     # also rejects NaN
+            raise ValueError('max_rate_hz has to be greater than zero but is {}.'.format(max_rate_hz))
         self._locked_during_update = False
+        self.max_rate_hz = max_rate_hz
+        self.updates_delivered = 0  # number of widget updates of a rate limited binding
+        self.updates_dropped = 0    # number of notifications of a rate limited binding which were merged into a later update
+        self._update_pending = False
+        self._last_update_time = -math.inf
+        if max_rate_hz is None:
+            self._listener_ = self._on_change_
+        else:
+            self._min_update_interval = 1.0 / max_rate_hz
+            self._listener_ = self._on_change_rate_limited_
         self.operation = operation
         self.inv_op = inv_op
         self._vm = data_context
-        self._vm.property_changed.connect(self._on_change_)     # listen to changes in the source
-        self.variable_name = variable_name      # name to listen for in changes
+        self._variable_name = None
+        self.variable_name = variable_name      # name to listen for in changes (registers the listener in the source)
         self.widget = widget    # widget to apply the changes to
         self.widget_attribute_setter = widget_attribute_setter  # setter method in widget
         self._signal = None     # signal to listen for in widget to apply changes to the source (reverse-direction)
         self._register_widget_event_(widget, widget_attribute_setter)   # check widget for valid signals
         self._setup_source_target_type_casting_()   # use operation/inv_op to setup type-casting (This enables the usage of number based data in e.g. QLineEdit widgets)
+        self._resolve_widget_update_()  # resolve the widget setter once instead of on every change
         self._on_change_(self.variable_name)    # apply the current data to the widget
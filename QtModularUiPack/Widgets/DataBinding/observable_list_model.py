@@ -0,0 +1,157 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework import ObservableList, GuiDispatcher
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from operator import attrgetter
+
+
+class ObservableListModel(QAbstractTableModel):
+    """
+    Item model that presents an observable list to Qt item views (QListView, QTableView, QComboBox, ...).
+    Changes of the list are forwarded as row insertions and removals, so views only update the affected rows.
+    The model presents its own copy of the rows which follows the list change by change on the GUI thread, so the views
+    stay consistent while the list is changed by other threads.
+    """
+
+    @property
+    def items(self):
+        """
+        Gets the observable list presented by the model
+        """
+        return self._items
+
+    @items.setter
+    def items(self, value: ObservableList):
+        """
+        Sets the observable list presented by the model
+        :param value: observable list (or None)
+        """
+        self.beginResetModel()
+        if self._items is not None:     # stop listening to the old list
+            self._items.items_inserted.disconnect(self._on_items_inserted_)
+            self._items.items_removed.disconnect(self._on_items_removed_)
+            self._items.items_reset.disconnect(self._on_items_reset_)
+
+        self._items = value
+        self._rows = list()
+        if self._items is not None:     # listen to changes of the new list
+            self._items.items_inserted.connect(self._on_items_inserted_)
+            self._items.items_removed.connect(self._on_items_removed_)
+            self._items.items_reset.connect(self._on_items_reset_)
+            self._rows = list(self._items)
+        self.endResetModel()
+
+    def __init__(self, items=None, columns=None, parent=None):
+        """
+        :param items: observable list
+        :param columns: (Optional) list of (header, attribute) tuples. The attribute can be the name of a member of the
+                        items or a function which takes the item. By default one column shows str(item).
+        :param parent: parent object
+        """
+        super().__init__(parent)
+        self._columns = list()
+        for header, attribute in columns if columns is not None else [('', str)]:
+            getter = attribute if callable(attribute) else attrgetter(attribute)
+            self._columns.append((header, getter))
+        self._items = None
+        self._rows = list()     # items of the rows announced to the views (follows the list change by change)
+        self.items = items
+
+    def item(self, row):
+        """
+        Returns the list item of a given row (as presented to the views)
+        :param row: row index
+        :return: item
+        """
+        return self._rows[row]
+
+    def refresh_row(self, row):
+        """
+        Tell the views that the data of an item has changed
+        :param row: row index
+        """
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._columns) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        row = index.row()
+        if not index.isValid() or row >= len(self._rows):
+            return None
+        if role == Qt.DisplayRole:
+            return self._columns[index.column()][1](self._rows[row])
+        if role == Qt.UserRole:
+            return self._rows[row]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._columns):
+            return self._columns[section][0]
+        return super().headerData(section, orientation, role)
+
+    def _on_items_inserted_(self, start, items):
+        """
+        Callback for items which were inserted into the list
+        :param start: index of the first inserted item
+        :param items: inserted items
+        """
+        dispatcher = GuiDispatcher.instance
+        if not dispatcher.is_gui_thread():  # models must only change on the GUI thread
+            dispatcher.post(self._on_items_inserted_, start, list(items))
+            return
+        if not items:
+            return  # an empty range is no valid row range
+
+        self.beginInsertRows(QModelIndex(), start, start + len(items) - 1)
+        self._rows[start:start] = items
+        self.endInsertRows()
+
+    def _on_items_removed_(self, start, items):
+        """
+        Callback for items which were removed from the list
+        :param start: index of the first removed item
+        :param items: removed items
+        """
+        dispatcher = GuiDispatcher.instance
+        if not dispatcher.is_gui_thread():  # models must only change on the GUI thread
+            dispatcher.post(self._on_items_removed_, start, list(items))
+            return
+        if not items:
+            return  # an empty range is no valid row range
+
+        self.beginRemoveRows(QModelIndex(), start, start + len(items) - 1)
+        del self._rows[start:start + len(items)]
+        self.endRemoveRows()
+
+    def _on_items_reset_(self, items=None):
+        """
+        Callback for changes of the list that cannot be described by a single range (e.g. sorting)
+        :param items: (Optional) content of the list at the time of the change (taken if the change was made by another
+                      thread, the current content is used otherwise)
+        """
+        dispatcher = GuiDispatcher.instance
+        if not dispatcher.is_gui_thread():  # models must only change on the GUI thread
+            dispatcher.post(self._on_items_reset_, list(self._items))
+            return
+
+        self.beginResetModel()
+        self._rows = list(items) if items is not None else list(self._items)
+        self.endResetModel()
@@ -3,6 +3,7 @@ from .video_editor import VideoEditor
 from .py_graph_widget import PyGraphWidget, PY_GRAPH_PLOT_MODE_IMAGE, PY_GRAPH_PLOT_MODE_LINE, PyGraphCustomPlotDataItem, PyGraphSubPlotWindow
 from .plot_widget import PlotWidget, PlotConfig, PlotMasterWidget, PlotWidgetItem
 from .empty_frame import EmptyFrame
+from .frame_catalog import FrameCatalog
 from .modular_frame import ModularFrame
 from .modular_frame_host import ModularFrameHost
 from .modular_application import ModularApplication
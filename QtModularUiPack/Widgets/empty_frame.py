@@ -58,7 +58,7 @@ class EmptyFrame(QFrame, BindingEnabledWidget):
         main.show()
         QApplication.instance().exec_()
 
-    def add_widget(self, widget, binding_variable_name=None, binding_attribute_setter=None, width=None, height=None, operation=None, inv_op=None):
+    def add_widget(self, widget, binding_variable_name=None, binding_attribute_setter=None, width=None, height=None, operation=None, inv_op=None, max_rate_hz=None):
         """
         This utility method will take a widget and set it up with a binding and sets its dimensions.
         :param widget: newly created widget
@@ -66,10 +66,11 @@ class EmptyFrame(QFrame, BindingEnabledWidget):
         :param binding_attribute_setter: attribute of the widget the binding should update
         :param width: fixed width of the widget (no fixed width if None)
         :param height: fixed height of the widget (no fixed width if None)
+        :param max_rate_hz: maximum number of binding updates per second (no limit if None)
         :return:
         """
         if binding_variable_name is not None and binding_attribute_setter is not None:
-            self.bindings.set_binding(binding_variable_name, widget, binding_attribute_setter, operation=operation, inv_op=inv_op)
+            self.bindings.set_binding(binding_variable_name, widget, binding_attribute_setter, operation=operation, inv_op=inv_op, max_rate_hz=max_rate_hz)
 
         if width is not None:
             widget.setFixedWidth(width)
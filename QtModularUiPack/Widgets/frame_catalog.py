@@ -0,0 +1,194 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Widgets import EmptyFrame
+from QtModularUiPack.Widgets.utils import get_builtin_frames
+from QtModularUiPack.Framework import ModuleManager, Signal, ClassDescriptor, FolderWatcher
+import os
+
+
+def _entry_key(entry):
+    """
+    Returns what identifies a catalog entry (descriptors of unchanged files are equal but not identical)
+    :param entry: frame class or class descriptor
+    :return: comparable key
+    """
+    if isinstance(entry, ClassDescriptor):
+        return entry.class_name, entry.module_name, entry.path
+    return entry
+
+
+class FrameCatalog(object):
+    """
+    The tool frames which can be displayed in the modular frames of an application (built-in frames and the frames of
+    the search path). The discovery runs once per change and is shared by all modular frames of the application.
+    The version increases with every change such that the frames can tell whether their menus are up to date.
+    Optionally the search path is watched: frames which are added, removed or renamed are discovered in the background.
+    """
+
+    @property
+    def search_path(self):
+        """
+        Gets the path where additional tool frames are searched for
+        """
+        return self._search_path
+
+    @search_path.setter
+    def search_path(self, value):
+        """
+        Sets the path where additional tool frames are searched for
+        :param value: path (or None)
+        """
+        if value != self._search_path:
+            if self._watcher is not None and self._search_path is not None:
+                self._watcher.unwatch(self._search_path)
+            self._search_path = value
+            if self._watcher is not None and value is not None:
+                self._watcher.watch(value)
+            self._invalidate_()     # new entries appear in the menus, displayed frames stay as they are
+
+    @property
+    def watching(self):
+        """
+        True if the search path is watched for new, removed or modified tool frames
+        """
+        return self._watcher is not None
+
+    @watching.setter
+    def watching(self, value):
+        """
+        Starts or stops watching the search path
+        :param value: True or False
+        """
+        if value and self._watcher is None:
+            self._watcher = FolderWatcher(self._find_frames_, self._on_frames_found_)
+            if self._search_path is not None:
+                self._watcher.watch(self._search_path)
+        elif not value and self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    @property
+    def version(self):
+        """
+        Gets the number of changes of the catalog
+        """
+        return self._version
+
+    @property
+    def frame_types(self):
+        """
+        Gets the available frames as dictionary of display name -> frame class (or class descriptor of the search path)
+        """
+        if self._frame_types is None:
+            self._frame_types = self._discover_()
+        return self._frame_types
+
+    def __init__(self, search_path=None):
+        """
+        :param search_path: (Optional) path where additional tool frames are searched for
+        """
+        self.changed = Signal(int)  # new version after the frame classes were reloaded (the frames reload their content)
+        self.updated = Signal(list)     # display names of the entries which were added, removed or modified by the watcher
+        self._search_path = search_path
+        self._version = 0
+        self._frame_types = None
+        self._watcher = None
+
+    def get(self, name):
+        """
+        Returns the frame class (or class descriptor) of a display name
+        :param name: display name
+        :return: frame class or class descriptor
+        """
+        return self.frame_types[name]
+
+    def refresh(self):
+        """
+        Discover the frames again (on next use) and let the modular frames reload their content (e.g. after the modules
+        were reloaded)
+        """
+        self._invalidate_()
+        self.changed.emit(self._version)
+
+    def _invalidate_(self):
+        """
+        Drop the discovered frames and increase the version
+        """
+        self._frame_types = None
+        self._version += 1
+
+    def _discover_(self):
+        """
+        Find all available frames
+        :return: dictionary of display name -> frame class or class descriptor
+        """
+        frame_classes = list()
+        if self._search_path is not None:
+            frame_classes = self._find_frames_(self._search_path)
+        return self._merge_(frame_classes)
+
+    def _merge_(self, frame_classes):
+        """
+        Combine the built-in frames with the frames of the search path
+        :param frame_classes: class descriptors of the search path
+        :return: dictionary of display name -> frame class or class descriptor
+        """
+        frame_classes = get_builtin_frames() + frame_classes
+        frame_types = dict()
+        for cls in frame_classes:
+            name = cls.name
+            i = 1
+            already_present = True
+            while already_present:  # make sure that there are no duplicate names
+                already_present = name in frame_types
+                if already_present and name != 'empty frame':
+                    name = '{} ({})'.format(cls.name, i)
+                    i += 1
+                else:
+                    break
+            if not already_present:
+                frame_types[name] = cls
+        return frame_types
+
+    def _find_frames_(self, path):
+        """
+        Find the frames of a folder (also runs in the worker thread of the watcher)
+        :param path: folder
+        :return: list of class descriptors
+        """
+        return ModuleManager.instance.find_classes_derived_from(path, EmptyFrame)
+
+    def _on_frames_found_(self, path, frame_classes):
+        """
+        Callback of the watcher with the frames of the search path after files have changed (runs on the GUI thread).
+        Only publishes the entries which are different.
+        :param path: folder
+        :param frame_classes: list of class descriptors (None if the folder does not exist anymore)
+        """
+        if self._search_path is None or os.path.abspath(self._search_path) != path:
+            return
+        if self._frame_types is None:
+            return  # not discovered yet -> the next use discovers the current state anyway
+
+        frame_types = self._merge_(frame_classes if frame_classes is not None else list())
+        changed = [name for name in frame_types if name not in self._frame_types
+                   or _entry_key(frame_types[name]) != _entry_key(self._frame_types[name])]
+        changed += [name for name in self._frame_types if name not in frame_types]
+        if len(changed) > 0:
+            self._frame_types = frame_types
+            self._version += 1
+            self.updated.emit(changed)
@@ -18,6 +18,7 @@ from PyQt5.QtWidgets import QHBoxLayout
 from QtModularUiPack.ViewModels import BaseContextAwareViewModel, ModularApplicationViewModel
 from QtModularUiPack.Widgets import ModularFrameHost, EmptyFrame
 from QtModularUiPack.Framework.ImportTools.utils import is_non_strict_type, is_non_strict_subclass
+from QtModularUiPack.Framework import ModuleManager
 import os
 
 
@@ -42,6 +43,21 @@ class ModularApplication(EmptyFrame):
         """
         self._frame_host.frame_search_path = value
 
+    @property
+    def watch_frame_search_path(self):
+        """
+        True if the search path is watched for new, removed or renamed tool frames (discovered in the background)
+        """
+        return self._frame_host.watch_frame_search_path
+
+    @watch_frame_search_path.setter
+    def watch_frame_search_path(self, value):
+        """
+        Starts or stops watching the search path
+        :param value: True or False
+        """
+        self._frame_host.watch_frame_search_path = value
+
     def __init__(self, *args, frame_search_path=None, configuration_path=None, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -50,6 +66,7 @@ class ModularApplication(EmptyFrame):
         self.setLayout(self._layout)
         self.configuration_path = configuration_path
         self._save_file_locked = False
+        self._loaded_data_contexts = None   # ids of the listed data contexts while a layout is loaded (registry is behind)
 
         # content
         self._frame_host = ModularFrameHost(self, frame_search_path=frame_search_path)
@@ -61,14 +78,22 @@ class ModularApplication(EmptyFrame):
             self.load_settings(configuration_path)
 
     @classmethod
-    def standalone_application(cls, title=None, window_size=None, frame_search_path=None, configuration_path=None):
+    def standalone_application(cls, title=None, window_size=None, frame_search_path=None, configuration_path=None,
+                               warm_up=False, warm_up_folders=None, warm_up_modules=None):
         """
         Launch modular standalone application
         :param title: Application title
         :param window_size: initial window size
         :param frame_search_path: path to look for application frames
         :param configuration_path: path to save application state to (expected json file)
+        :param warm_up: compile the frame search path and the warm-up folders in the background while the window comes
+                        up and import the warm-up modules (see ModuleManager.warm_up())
+        :param warm_up_folders: (Optional) further plugin folders to compile (e.g. experiment folders)
+        :param warm_up_modules: (Optional) names of modules to import in the background (e.g. heavy libraries)
         """
+        if warm_up:
+            folders = [frame_search_path] + list(warm_up_folders if warm_up_folders is not None else [])
+            ModuleManager.instance.warm_up(folders, warm_up_modules)    # byte code is ready when the frames are loaded
         super().standalone_application(title, window_size,
                                        frame_search_path=frame_search_path,
                                        configuration_path=configuration_path)
@@ -79,8 +104,10 @@ class ModularApplication(EmptyFrame):
         :param child_data_context: data context that was added
         :return:
         """
-        if child_data_context not in self.data_context.other_data_contexts:
+        if not self._has_data_context_(child_data_context):
             self.data_context.other_data_contexts.append(child_data_context)
+            if self._loaded_data_contexts is not None:
+                self._loaded_data_contexts.add(id(child_data_context))
 
         if is_non_strict_subclass(type(child_data_context), BaseContextAwareViewModel):
             self.data_context.connect_context_aware_view_model(child_data_context)
@@ -93,14 +120,25 @@ class ModularApplication(EmptyFrame):
         :param child_data_context: data context that was removed
         :return:
         """
-        if child_data_context in self.data_context.other_data_contexts:
+        if self._has_data_context_(child_data_context):
             self.data_context.other_data_contexts.remove(child_data_context)
+            if self._loaded_data_contexts is not None:
+                self._loaded_data_contexts.discard(id(child_data_context))
 
         if is_non_strict_type(type(child_data_context), BaseContextAwareViewModel):
             self.data_context.disconnect_context_aware_view_model(child_data_context)
 
         self.save()
 
+    def _has_data_context_(self, data_context):
+        """
+        Returns true if the data context is in the list of data contexts of the application (identity lookup)
+        :param data_context: view model
+        """
+        if self._loaded_data_contexts is not None:  # the registry is only updated when the load is finished
+            return id(data_context) in self._loaded_data_contexts
+        return data_context in self.data_context.data_context_registry
+
     def load_settings(self, path):
         """
         Load settings of frames
@@ -108,7 +146,13 @@ class ModularApplication(EmptyFrame):
         """
         if os.path.isfile(path):
             self._save_file_locked = True
-            self._frame_host.load(path)
+            data_contexts = self.data_context.other_data_contexts
+            with data_contexts.suspend_notifications():     # announce restored data contexts at once
+                self._loaded_data_contexts = set(id(data_context) for data_context in data_contexts)
+                try:
+                    self._frame_host.load(path)
+                finally:
+                    self._loaded_data_contexts = None
             self._save_file_locked = False
 
     def save(self):
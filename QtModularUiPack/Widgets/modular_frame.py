@@ -16,10 +16,9 @@ limitations under the License.
 
 from PyQt5.QtWidgets import QFrame, QAction, QHBoxLayout, QMenuBar
 from PyQt5.QtCore import pyqtSignal
-from QtModularUiPack.Widgets import EmptyFrame
-from QtModularUiPack.Widgets.utils import get_builtin_frames
+from QtModularUiPack.Widgets.frame_catalog import FrameCatalog
 from QtModularUiPack.ViewModels import BaseViewModel
-from QtModularUiPack.Framework import ModuleManager
+from QtModularUiPack.Framework import ModuleManager, ClassDescriptor
 import traceback
 
 
@@ -53,6 +52,28 @@ class ModularFrame(QFrame):
                 return i
         return -1
 
+    @property
+    def frame_search_path(self):
+        """
+        Gets the path where additional tool frames are searched for
+        """
+        return self._catalog.search_path
+
+    @frame_search_path.setter
+    def frame_search_path(self, value):
+        """
+        Sets the path where additional tool frames are searched for (changes the catalog of all frames sharing it)
+        :param value: path
+        """
+        self._catalog.search_path = value
+
+    @property
+    def catalog(self):
+        """
+        Gets the catalog of the frames which can be displayed
+        """
+        return self._catalog
+
     @property
     def name(self):
         return self._name
@@ -66,11 +87,20 @@ class ModularFrame(QFrame):
             traceback.print_exc()
             self._name = None
 
-    def __init__(self, parent, splitter=None, name='empty frame', frame_search_path=None, *args, **kwargs):
+    def __init__(self, parent, splitter=None, name='empty frame', frame_search_path=None, catalog=None, *args, **kwargs):
+        """
+        :param parent: parent widget
+        :param splitter: splitter containing the frame
+        :param name: name of the tool frame to display
+        :param frame_search_path: path where additional tool frames are searched for (only used without catalog)
+        :param catalog: (Optional) frame catalog shared with the other frames of the application
+        """
         super(ModularFrame, self).__init__(parent, *args, **kwargs)
-        self.frame_search_path = frame_search_path
+        self._catalog = catalog if catalog is not None else FrameCatalog(frame_search_path)
+        self._catalog.changed.connect(self._on_catalog_changed_)
+        self._catalog.updated.connect(self._on_catalog_updated_)
+        self._menu_version = -1     # catalog version the view menu was filled with
         self.splitter = splitter
-        self._valid_frame_types = dict()
         self._setup_()
         self._name = None
         self.loaded_tool_frame = None
@@ -80,6 +110,8 @@ class ModularFrame(QFrame):
         super().destroyed(p_object)
 
     def deleteLater(self):
+        self._catalog.changed.disconnect(self._on_catalog_changed_)
+        self._catalog.updated.disconnect(self._on_catalog_updated_)
         if self.loaded_tool_frame is not None and 'data_context_changed' in dir(self.loaded_tool_frame):
             self.loaded_tool_frame.data_context_changed.disconnect(self._on_data_context_changed_)
         super().deleteLater()
@@ -106,13 +138,21 @@ class ModularFrame(QFrame):
             self.on_remove.emit(self)
 
     def _set_view_button_(self, q):
-        self._set_view_(q.text())
+        try:
+            self._set_view_(q.text())
+        except Exception as e:  # exceptions must not leave the Qt slot
+            print('unable to setup frame with "{}". Error: {}'.format(q.text(), e))
+            traceback.print_exc()
 
     def _set_view_(self, name):
         """
         Sets the content of the frame to a specified control.
         :param name: argument
         """
+        frame_type = self._catalog.get(name)
+        if isinstance(frame_type, ClassDescriptor):     # frames of the search path are only imported once they are selected
+            frame_type = ModuleManager.instance.load_class(frame_type)  # before anything is torn down (might fail)
+
         # stop listen for changes in the data context
         if self.loaded_tool_frame is not None and 'data_context_changed' in dir(self.loaded_tool_frame):
             self.loaded_tool_frame.data_context_changed.disconnect(self._on_data_context_changed_)
@@ -129,7 +169,7 @@ class ModularFrame(QFrame):
             if child.widget():
                 child.widget().deleteLater()
 
-        self.loaded_tool_frame = self._valid_frame_types[name](self)
+        self.loaded_tool_frame = frame_type(self)
         self.content.addWidget(self.loaded_tool_frame)
         self._frame_menu_button.raise_()
         self._name = name
@@ -151,33 +191,37 @@ class ModularFrame(QFrame):
     def get_possible_frames(self):
         """
         Get available frames for the modular frame to display.
+        :return: dictionary of display name -> frame class (or class descriptor)
+        """
+        return self._catalog.frame_types
+
+    def _fill_view_menu_(self):
         """
-        # clear existing frame types
-        self._valid_frame_types.clear()
+        Callback to fill the view menu before it is shown (only if the catalog has changed since the last time)
+        """
+        if self._menu_version == self._catalog.version:
+            return
         self._view_menu.clear()
+        for name in self._catalog.frame_types:
+            self._view_menu.addAction(name)
+        self._menu_version = self._catalog.version
+
+    def _on_catalog_changed_(self, version):
+        """
+        Callback for changes of the frame catalog. Reloads the displayed frame (its class might have been reloaded).
+        :param version: new catalog version
+        """
+        if self._name is not None:
+            self.name = self._name
 
-        # get classes
-        frame_classes = get_builtin_frames()
-        if self.frame_search_path is not None:
-            additional = ModuleManager.instance.load_classes_from_folder_derived_from(self.frame_search_path, EmptyFrame)
-            frame_classes += additional
-
-        for cls in frame_classes:
-            name = cls.name
-            i = 1
-            already_present = True
-            while already_present:  # make sure that there are no duplicate names
-                already_present = name in self._valid_frame_types
-                if already_present and name != 'empty frame':
-                    name = '{} ({})'.format(cls.name, i)
-                    i += 1
-                else:
-                    break
-            if not already_present:
-                self._valid_frame_types[name] = cls
-                self._view_menu.addAction(name)
-        if '_name' in dir(self):
-            self.name = self._name  # reload current frame
+    def _on_catalog_updated_(self, names):
+        """
+        Callback for entries of the catalog which were added, removed or modified in the search path. The displayed
+        frame stays as it is, the view menu is updated right away if it is open (otherwise before it is shown next).
+        :param names: display names of the changed entries
+        """
+        if self._view_menu.isVisible():
+            self._fill_view_menu_()
 
     def _setup_(self):
         """
@@ -192,7 +236,7 @@ class ModularFrame(QFrame):
         menu.addAction(TEXT_SPLIT_VERTICALLY)          # add the action to split vertically
         menu.addAction(TEXT_REMOVE)                    # add the action to remove
         self._view_menu = menu.addMenu(TEXT_VIEW)
-        self.get_possible_frames()
+        self._view_menu.aboutToShow.connect(self._fill_view_menu_)  # the entries are only created when needed
         menu.triggered[QAction].connect(self._request_action_)   # connect the events
         self._view_menu.triggered[QAction].connect(self._set_view_button_)
         self._frame_menu_button.raise_()    # make sure the button is above all other widgets
@@ -17,6 +17,7 @@ limitations under the License.
 from PyQt5.QtWidgets import QSplitter, QStackedWidget, QFrame
 from PyQt5.QtCore import Qt, pyqtSignal
 from QtModularUiPack.Widgets import ModularFrame
+from QtModularUiPack.Widgets.frame_catalog import FrameCatalog
 from QtModularUiPack.ViewModels import BaseViewModel
 from QtModularUiPack.Framework import ModuleManager
 import json
@@ -37,7 +38,7 @@ class ModularFrameHost(QStackedWidget):
         Gets the path where the host looks for tool frames which can be displayed
         :return: path
         """
-        return self._frame_search_path
+        return self._catalog.search_path
 
     @frame_search_path.setter
     def frame_search_path(self, value):
@@ -45,9 +46,22 @@ class ModularFrameHost(QStackedWidget):
         Sets the path where the host looks for tool frames which can eb displayed
         :param value: path
         """
-        self._frame_search_path = value
-        for frame in self._modular_frames:
-            frame.frame_search_path = value
+        self._catalog.search_path = value   # the frames share the catalog
+
+    @property
+    def watch_frame_search_path(self):
+        """
+        True if the search path is watched for new, removed or renamed tool frames (discovered in the background)
+        """
+        return self._catalog.watching
+
+    @watch_frame_search_path.setter
+    def watch_frame_search_path(self, value):
+        """
+        Starts or stops watching the search path
+        :param value: True or False
+        """
+        self._catalog.watching = value
 
     @property
     def is_restoring(self):
@@ -58,7 +72,7 @@ class ModularFrameHost(QStackedWidget):
 
     def __init__(self, parent, frame_search_path=None, *args, **kwargs):
         super(ModularFrameHost, self).__init__(parent, *args, **kwargs)
-        self._frame_search_path = frame_search_path
+        self._catalog = FrameCatalog(frame_search_path)     # discovery and menu entries shared by all frames
         self._base_splitter = None
         self._is_restoring = False
         self._setup_frame_host_()
@@ -93,11 +107,12 @@ class ModularFrameHost(QStackedWidget):
 
     def reload_possible_frames(self):
         """
-        Re-imports all possible tool frame classes which can be used in the modular frames.
+        Re-imports the modified tool frame modules (and the modules depending on them) and looks for new tool frames.
+        :return: reload report (reloaded modules and durations)
         """
-        ModuleManager.instance.reload_modules()
-        for frame in self._modular_frames:
-            frame.get_possible_frames()
+        report = ModuleManager.instance.reload_modules()
+        self._catalog.refresh()     # discovers the frames once and lets every frame reload its content
+        return report
 
     def split_frame(self, frame, orientation):
         """
@@ -270,7 +285,7 @@ class ModularFrameHost(QStackedWidget):
         Add a new frame.
         :return: New frame that has been setup to work with the proper event handling.
         """
-        frame = ModularFrame(self, frame_search_path=self.frame_search_path)  # new frame
+        frame = ModularFrame(self, catalog=self._catalog)  # new frame
         frame.setFrameShape(QFrame.StyledPanel)     # add borders
         frame.on_split_horizontal.connect(self._on_split_horizontal_)    # listen for horizontal split requests
         frame.on_split_vertical.connect(self._on_split_vertical_)    # listen for vertical split requests
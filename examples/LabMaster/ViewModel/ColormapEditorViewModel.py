@@ -263,23 +263,24 @@ class ColormapEditorViewModel(BaseViewModel):
         self.save()
 
     def _set_color_map_(self, map_image):
-        self.color_image = map_image
-        self.red_values = self.color_image.red
-        self.green_values = self.color_image.green
-        self.blue_values = self.color_image.blue
-        self._raw_red = np.array(self._red_values)
-        self._raw_green = np.array(self._green_values)
-        self._raw_blue = np.array(self._blue_values)
-        self.colors_minimum = 0
-        self.colors_maximum = len(self.red_values[0]) - 1
-        self.colors_upper_boundary = len(self.red_values[0]) - 1
-        self.colors_lower_boundary = 0
-        self.red_upper_boundary = len(self.red_values[0]) - 1
-        self.red_lower_boundary = 0
-        self.green_upper_boundary = len(self.green_values[0]) - 1
-        self.green_lower_boundary = 0
-        self.blue_upper_boundary = len(self.blue_values[0]) - 1
-        self.blue_lower_boundary = 0
+        with self.defer_notifications():    # merge the notifications of all the setters below
+            self.color_image = map_image
+            self.red_values = self.color_image.red
+            self.green_values = self.color_image.green
+            self.blue_values = self.color_image.blue
+            self._raw_red = np.array(self._red_values)
+            self._raw_green = np.array(self._green_values)
+            self._raw_blue = np.array(self._blue_values)
+            self.colors_minimum = 0
+            self.colors_maximum = len(self.red_values[0]) - 1
+            self.colors_upper_boundary = len(self.red_values[0]) - 1
+            self.colors_lower_boundary = 0
+            self.red_upper_boundary = len(self.red_values[0]) - 1
+            self.red_lower_boundary = 0
+            self.green_upper_boundary = len(self.green_values[0]) - 1
+            self.green_lower_boundary = 0
+            self.blue_upper_boundary = len(self.blue_values[0]) - 1
+            self.blue_lower_boundary = 0
 
     def import_from_matplot(self, map_name):
         self._set_color_map_(ColorMapImage(map_name))
@@ -0,0 +1,45 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')     # the tests run without a display
+
+from PyQt5.QtWidgets import QApplication
+from timeit import repeat
+import pytest
+
+
+@pytest.fixture(scope='session')
+def app():
+    """
+    Qt application shared by all tests (the GUI thread is the thread running the tests)
+    """
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def measure():
+    """
+    Returns a function which measures the time of one call of functions (best of several runs, robust against noise).
+    Several functions are measured in alternation such that a burst of noise does not favour one of them.
+    """
+    def best_time(*functions, number=1000, runs=5):
+        best = [float('inf')] * len(functions)
+        for run in range(runs):
+            for i, function in enumerate(functions):
+                best[i] = min(best[i], min(repeat(function, number=number, repeat=1)) / number)
+        return best[0] if len(functions) == 1 else tuple(best)
+    return best_time
@@ -0,0 +1,88 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+pytest.importorskip('PyQt5.QtMultimedia', exc_type=ImportError)     # the widgets need the multimedia module
+
+from QtModularUiPack.ViewModels import BaseViewModel
+from QtModularUiPack.Widgets.DataBinding import BindingManager
+from time import perf_counter
+import gc
+
+
+class _Widget(object):
+    """
+    Widget stand-in with a text setter
+    """
+
+    def __init__(self):
+        self.text = None
+
+    def setText(self, text):
+        self.text = text
+
+
+def _build(count):
+    """
+    Bind a new view model with the given number of properties to as many widgets (like a frame with many widgets)
+    :param count: number of bindings
+    :return: time per binding in seconds, binding manager, widgets
+    """
+    view_model = BaseViewModel()
+    for i in range(count):
+        setattr(view_model, 'value_{}'.format(i), i)
+    widgets = [_Widget() for _ in range(count)]
+    gc.disable()    # collections depend on all objects alive in the process (like timeit)
+    try:
+        start = perf_counter()
+        manager = BindingManager(view_model)
+        for i, widget in enumerate(widgets):
+            manager.set_binding('value_{}'.format(i), widget, 'setText')
+            manager.get_binding(widget, 'setText')
+        duration = perf_counter() - start
+    finally:
+        gc.enable()
+    return duration / count, manager, widgets
+
+
+def test_frame_construction_time_grows_linearly_with_bindings():
+    costs = dict()
+    for count in (100, 1000, 10000):
+        costs[count] = min(_build(count)[0] for _ in range(3))
+
+    # with dir() on every set_binding and a list scan on every get_binding the cost per binding grew with the count
+    assert costs[10000] < costs[100] * 3
+    assert costs[1000] < costs[100] * 3
+
+
+def test_destroy_and_rebinding_after_many_bindings():
+    cost, manager, widgets = _build(10000)
+    assert manager.get_binding(widgets[-1], 'setText').variable_name == 'value_9999'
+
+    manager.set_binding('value_0', widgets[-1], 'setText')  # rebinding the widget to another property
+    assert manager.get_binding(widgets[-1], 'setText').variable_name == 'value_0'
+    assert len(manager.get_bindings('value_9999')) == 0
+    assert len(manager.get_bindings('value_0')) == 2
+
+    gc.disable()
+    try:
+        start = perf_counter()
+        manager.destroy()
+        duration = perf_counter() - start
+    finally:
+        gc.enable()
+    assert duration < cost * 10000 * 3  # destroying does not cost more than building
+    assert manager.get_binding(widgets[0], 'setText') is None
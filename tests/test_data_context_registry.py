@@ -0,0 +1,94 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.ViewModels import BaseViewModel, BaseContextAwareViewModel, DataContextRegistry
+from QtModularUiPack.Framework import ObservableList
+
+
+class _Tool(BaseViewModel):
+    name = 'tool'
+
+
+def _listen(view_model):
+    """
+    Record the notifications of a context aware view model about other data contexts
+    :param view_model: context aware view model
+    :return: list of (kind, number of data contexts)
+    """
+    calls = list()
+    view_model.other_data_context_was_added.connect(lambda data_context: calls.append(('added', 1)))
+    view_model.other_data_context_was_removed.connect(lambda data_context: calls.append(('removed', 1)))
+    view_model.other_data_contexts_were_added.connect(lambda data_contexts: calls.append(('added', len(data_contexts))))
+    view_model.other_data_contexts_were_removed.connect(lambda data_contexts: calls.append(('removed', len(data_contexts))))
+    return calls
+
+
+def test_suspended_load_is_announced_as_one_batch():
+    data_contexts = ObservableList()
+    registry = DataContextRegistry(data_contexts)
+    view_model = BaseContextAwareViewModel()
+    view_model.data_context_registry = registry
+    calls = _listen(view_model)
+    item_signals = list()
+    data_contexts.item_added.connect(item_signals.append)
+
+    tools = [_Tool() for _ in range(100)]
+    with data_contexts.suspend_notifications():
+        for tool in tools:
+            data_contexts.append(tool)
+
+    assert calls == [('added', 100)]
+    assert item_signals == []
+    assert [registry.name_of(tool) for tool in tools[:3]] == ['tool', 'tool2', 'tool3']
+
+    with data_contexts.suspend_notifications():
+        del data_contexts[:40]
+    assert calls[-1] == ('removed', 40)
+
+
+def test_single_changes_are_announced_per_item():
+    data_contexts = ObservableList()
+    registry = DataContextRegistry(data_contexts)
+    view_model = BaseContextAwareViewModel()
+    view_model.data_context_registry = registry
+    calls = _listen(view_model)
+
+    tool = _Tool()
+    data_contexts.append(tool)
+    data_contexts.remove(tool)
+    data_contexts.extend([_Tool(), _Tool()])
+    assert calls == [('added', 1), ('removed', 1), ('added', 2)]
+
+
+def test_context_aware_view_model_creates_its_registry_lazily():
+    view_model = BaseContextAwareViewModel()
+    assert view_model.data_context_registry is None     # nothing is built before the application provides a registry
+    assert len(view_model.data_context_container.__dict__) == 0
+
+    registry = DataContextRegistry(ObservableList([_Tool()]))
+    view_model.data_context_registry = registry
+    assert view_model.other_data_contexts is registry.data_contexts
+    assert view_model.data_context_container.tool is registry.data_contexts[0]
+
+    view_model.other_data_contexts = None
+    assert view_model.data_context_registry is None
+    assert view_model._other_data_contexts is None
+
+    standalone = BaseContextAwareViewModel()
+    calls = _listen(standalone)
+    standalone.other_data_contexts.append(_Tool())  # used without an application -> own list and registry
+    assert standalone.data_context_registry is not None and calls == [('added', 1)]
+    assert standalone.data_context_container.tool is standalone.other_data_contexts[0]
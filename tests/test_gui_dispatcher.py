@@ -0,0 +1,98 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.Extensions.gui_dispatcher import GuiDispatcher
+from PyQt5.QtCore import QCoreApplication
+from threading import Thread, Barrier, get_ident
+from time import perf_counter
+
+
+PRODUCERS = 8
+CALLS_PER_PRODUCER = 5000
+
+
+def _pump_until(condition, timeout=30.0):
+    """
+    Process Qt events on the calling (GUI) thread until the condition is met
+    :param condition: function returning true when done
+    :param timeout: maximum time in seconds
+    :return: true if the condition was met
+    """
+    deadline = perf_counter() + timeout
+    while not condition():
+        if perf_counter() > deadline:
+            return False
+        QCoreApplication.processEvents()
+    return True
+
+
+def test_concurrent_producers_deliver_every_call_in_order_on_gui_thread(app):
+    dispatcher = GuiDispatcher.instance
+    gui_thread = get_ident()
+    received = [list() for _ in range(PRODUCERS)]
+    foreign_threads = list()
+
+    def record(producer, number):
+        if get_ident() != gui_thread:
+            foreign_threads.append(get_ident())
+        received[producer].append(number)
+
+    barrier = Barrier(PRODUCERS)    # all producers start posting at the same time
+
+    def produce(producer):
+        barrier.wait()
+        for number in range(CALLS_PER_PRODUCER):
+            dispatcher.post(record, producer, number)
+
+    threads = [Thread(target=produce, args=(i,)) for i in range(PRODUCERS)]
+    for thread in threads:
+        thread.start()
+
+    done = lambda: all(not t.is_alive() for t in threads) and \
+        sum(len(r) for r in received) >= PRODUCERS * CALLS_PER_PRODUCER
+    assert _pump_until(done), 'not all posted calls were executed'
+
+    for thread in threads:
+        thread.join()
+    QCoreApplication.processEvents()    # nothing may arrive after all calls were delivered
+
+    assert foreign_threads == []
+    for producer in range(PRODUCERS):
+        assert received[producer] == list(range(CALLS_PER_PRODUCER))   # no loss, no duplicates, order of each producer
+
+
+def test_concurrent_keyed_posts_are_merged(app):
+    dispatcher = GuiDispatcher.instance
+    calls = list()
+    barrier = Barrier(PRODUCERS)
+
+    def produce():
+        barrier.wait()
+        for _ in range(1000):
+            dispatcher.post(calls.append, 'refresh', key='refresh')
+
+    threads = [Thread(target=produce) for _ in range(PRODUCERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert _pump_until(lambda: len(calls) > 0)
+    QCoreApplication.processEvents()
+
+    assert calls == ['refresh']     # all posts were waiting for the same drain
+    calls.clear()
+    QCoreApplication.processEvents()
+    assert calls == []
@@ -0,0 +1,80 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+pytest.importorskip('PyQt5.QtMultimedia', exc_type=ImportError)     # the widgets need the multimedia module
+
+from QtModularUiPack.Framework import ObservableList
+from QtModularUiPack.Widgets.DataBinding.observable_list_model import ObservableListModel
+from PyQt5.QtCore import QCoreApplication, Qt
+from PyQt5.QtTest import QAbstractItemModelTester
+from threading import Thread
+
+
+def _rows(model):
+    """
+    Returns the displayed text of all rows of a model
+    :param model: item model
+    :return: list of texts
+    """
+    return [model.data(model.index(row, 0), Qt.DisplayRole) for row in range(model.rowCount())]
+
+
+def _run_in_thread(function):
+    """
+    Run a function in a worker thread and wait for it
+    :param function: function
+    """
+    thread = Thread(target=function, daemon=True)
+    thread.start()
+    thread.join(10)
+
+
+def test_model_keeps_its_rows_until_changes_of_workers_arrive(app):
+    items = ObservableList(['a', 'b', 'c'])
+    model = ObservableListModel(items)
+    tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+
+    def change():
+        items.append('d')
+        items.pop(0)
+        items[0] = 'B'
+    _run_in_thread(change)
+
+    assert _rows(model) == ['a', 'b', 'c']  # the posted changes have not arrived yet
+    assert model.item(0) == 'a'
+    QCoreApplication.processEvents()
+    assert _rows(model) == list(items) == ['B', 'c', 'd']
+    assert model.data(model.index(0, 0), Qt.UserRole) == 'B'
+
+    _run_in_thread(items.reverse)  # reset with the content at the time of the change
+    _run_in_thread(lambda: items.append('e'))
+    assert _rows(model) == ['B', 'c', 'd']
+    QCoreApplication.processEvents()
+    assert _rows(model) == list(items) == ['d', 'c', 'B', 'e']
+    del tester
+
+
+def test_model_follows_changes_on_gui_thread(app):
+    items = ObservableList()
+    model = ObservableListModel(items)
+    tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    items.extend(range(5))
+    del items[1:3]
+    items.insert(0, 9)
+    items.sort()
+    assert _rows(model) == [str(item) for item in items]
+    del tester
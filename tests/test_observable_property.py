@@ -0,0 +1,70 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import pytest
+pytest.importorskip('PyQt5.QtMultimedia', exc_type=ImportError)     # the tool frames need the multimedia module
+
+from QtModularUiPack.ViewModels import BaseViewModel, ObservableProperty
+from QtModularUiPack.ModularApplications.ToolFrameViewModels.hello_world_view_model import HelloWorldViewModel
+
+
+class _ObservableHelloWorldViewModel(BaseViewModel):
+    """
+    HelloWorldViewModel written with observable properties
+    """
+
+    name = 'hello_world'
+    upper_text = ObservableProperty('Hello World!')
+    lower_text = ObservableProperty('Goodbye')
+
+
+def _connected(view_model):
+    """
+    Connect a listener to a view model
+    :param view_model: view model
+    :return: list of the notified names
+    """
+    names = list()
+    view_model.property_changed.connect(names.append)
+    return names
+
+
+def test_observable_property_is_as_fast_as_hand_written_property(measure):
+    hand_written, observable = HelloWorldViewModel(), _ObservableHelloWorldViewModel()
+    _connected(hand_written), _connected(observable)
+    assert observable.upper_text == hand_written.upper_text
+
+    get_hand_written, get_observable = measure(lambda: hand_written.upper_text, lambda: observable.upper_text,
+                                               number=100000)
+    assert get_observable < get_hand_written * 1.5
+
+    def switch(view_model):
+        view_model.upper_text = 'a' if view_model.upper_text == 'b' else 'b'
+    set_hand_written, set_observable = measure(lambda: switch(hand_written), lambda: switch(observable), number=20000)
+    assert set_observable < set_hand_written * 2    # the comparison with the old value is the only extra work
+
+
+def test_setting_equal_value_skips_the_notification(measure):
+    hand_written, observable = HelloWorldViewModel(), _ObservableHelloWorldViewModel()
+    hand_written_names, observable_names = _connected(hand_written), _connected(observable)
+
+    def set_same(view_model):
+        view_model.upper_text = 'Hello World!'
+    set_hand_written, set_observable = measure(lambda: set_same(hand_written), lambda: set_same(observable),
+                                               number=20000)
+
+    assert len(hand_written_names) > 0 and observable_names == []
+    assert set_observable < set_hand_written    # no round trip through the listeners
@@ -0,0 +1,99 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.Extensions.signal import Signal
+from QtModularUiPack.Framework.Extensions.gui_dispatcher import GuiDispatcher
+from PyQt5.QtCore import QCoreApplication
+from threading import Thread, get_ident
+from time import perf_counter
+
+
+EMITS = 100000
+
+
+def test_100k_cross_thread_emits(app, monkeypatch):
+    dispatcher = GuiDispatcher.instance
+    wakeups = list()
+    drain = dispatcher._drain_
+
+    def counting_drain():
+        wakeups.append(len(received))
+        drain()
+    monkeypatch.setattr(dispatcher, '_drain_', counting_drain)
+    monkeypatch.setattr(dispatcher, '_invoker', None)   # a new invoker calls the counting drain
+
+    gui_thread = get_ident()
+    received, foreign_threads = list(), list()
+
+    def handler(value):
+        if get_ident() != gui_thread:
+            foreign_threads.append(get_ident())
+        received.append(value)
+
+    signal = Signal(int)
+    signal.connect(handler, queued=True)
+
+    start = perf_counter()
+    for i in range(EMITS):
+        handler(i)  # baseline: the same handler called directly
+    direct = perf_counter() - start
+    received.clear()
+
+    def produce():
+        for i in range(EMITS):
+            signal.emit(i)
+
+    start = perf_counter()
+    producer = Thread(target=produce, daemon=True)
+    producer.start()
+    deadline = start + 60
+    while len(received) < EMITS and perf_counter() < deadline:
+        QCoreApplication.processEvents()
+    queued = perf_counter() - start
+    producer.join(10)
+
+    assert received == list(range(EMITS))   # every emit in order
+    assert foreign_threads == []
+    assert len(wakeups) < EMITS / 100   # many emits share one event loop wakeup
+    assert queued < direct * 50 + 1.0   # marshalling costs a few microseconds per emit, not a wakeup each
+
+
+def test_calls_posted_before_disconnect_are_dropped(app):
+    received = list()
+
+    class Receiver(object):
+        def on_value(self, value):
+            received.append(value)
+
+    receiver = Receiver()
+    signal = Signal(int)
+    signal.connect(receiver.on_value, queued=True)
+
+    def emit_from_worker(value):
+        producer = Thread(target=signal.emit, args=(value,), daemon=True)
+        producer.start()
+        producer.join(10)
+
+    emit_from_worker(1)
+    signal.disconnect(receiver.on_value)
+    QCoreApplication.processEvents()
+    assert received == []   # like a queued Qt connection: nothing is delivered after disconnect()
+
+    emit_from_worker(2)
+    signal.connect(receiver.on_value, queued=True)  # a new connection does not receive calls of the old one
+    emit_from_worker(3)
+    QCoreApplication.processEvents()
+    assert received == [3]
@@ -0,0 +1,144 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.Extensions.signal import Signal
+import pytest
+from timeit import repeat
+from weakref import ref
+import gc
+
+
+FRAMES = 10000
+
+
+class _Frame(object):
+    """
+    Stands in for a frame whose view model handler is connected to a long-living signal
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def on_changed(self, value):
+        self.calls += 1
+
+
+def _emit_cost(signal, number=1000):
+    """
+    Returns the best time of one emit of the signal
+    :param signal: signal to emit
+    :param number: number of emits per measurement
+    :return: time in seconds
+    """
+    return min(repeat(lambda: signal.emit(1), number=number, repeat=5)) / number
+
+
+def test_emit_cost_returns_to_baseline_after_frames_were_deleted():
+    signal = Signal(int)
+    survivor = _Frame()
+    signal.connect(survivor.on_changed)
+    baseline = _emit_cost(signal)
+
+    frames = [_Frame() for _ in range(FRAMES)]
+    for frame in frames:
+        signal.connect(frame.on_changed)
+    loaded = _emit_cost(signal, number=5)
+    references = [ref(frame) for frame in frames]
+
+    del frames, frame
+    gc.collect()
+
+    assert all(reference() is None for reference in references)    # the connections do not keep the frames alive
+    assert len(signal._callbacks) == 1  # dead connections were purged, not only skipped
+    assert len(signal._get_snapshot_()) == 1
+    purged = _emit_cost(signal)
+    assert purged < loaded / 100
+    assert purged < baseline * 3 + 1e-6     # slack for timer noise on busy machines
+    assert survivor.calls > 0
+
+
+def test_strong_connections_keep_their_frames():
+    signal = Signal(int)
+    frame = _Frame()
+    signal.connect(frame.on_changed, weak=False)
+    reference = ref(frame)
+
+    del frame
+    gc.collect()
+
+    assert reference() is not None
+    signal.emit(1)
+    assert reference().calls == 1
+
+
+class _SlottedFrame(object):
+    """
+    Object which does not support weak references
+    """
+
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls = 0
+
+    def on_changed(self, value):
+        self.calls += 1
+
+
+def test_objects_without_weak_references_are_connected_strongly():
+    signal = Signal(int)
+    frame = _SlottedFrame()
+    signal.connect(frame.on_changed)
+    signal.connect(frame.on_changed)    # connected once
+    signal.emit(1)
+    assert frame.calls == 1
+
+    signal.disconnect(frame.on_changed)
+    signal.emit(1)
+    assert frame.calls == 1
+
+
+def _emits_per_second(handlers):
+    """
+    Returns the emits per second of a signal with two typed arguments with and without validation
+    :param handlers: number of connected handlers
+    :return: emits per second with validation, emits per second without validation (best of several runs)
+    """
+    signal = Signal(str, int)
+    frames = [_Frame() for _ in range(handlers)]
+    for frame in frames:
+        signal.connect(lambda text, value, frame=frame: frame.on_changed(value))
+    number = max(50, 4000 // handlers)
+    best = {True: float('inf'), False: float('inf')}
+    try:
+        for run in range(20):   # alternate the modes in short runs, a burst of noise does not hit only one of them
+            for validated in (True, False):
+                Signal.set_validation_enabled(validated)
+                best[validated] = min(best[validated], min(repeat(lambda: signal.emit('value', 1), number=number, repeat=1)))
+    finally:
+        Signal.set_validation_enabled(True)
+    return number / best[True], number / best[False]
+
+
+def test_emits_per_second_with_and_without_validation():
+    for handlers in (1, 10, 100):
+        validated, unvalidated = _emits_per_second(handlers)
+        assert unvalidated > validated * 0.8    # skipping the checks never costs throughput (margin for timer noise)
+        if handlers == 1:
+            assert unvalidated > validated * 1.2    # the checks are a noticeable part of an emit to a single handler
+
+    with pytest.raises(TypeError):     # the production mode was switched off again
+        Signal(str, int).emit(1, 1)
@@ -0,0 +1,74 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.Framework.ImportTools.utils import is_non_strict_subclass
+from QtModularUiPack.ViewModels import BaseViewModel
+from types import ModuleType
+
+
+def _plugin_module(name):
+    """
+    Creates a module with thousands of globals and a three level hierarchy of view models (like a large plugin)
+    :param name: module name
+    :return: module
+    """
+    lines = ['from QtModularUiPack.ViewModels import BaseViewModel',
+             'class Base(BaseViewModel): pass',
+             'class Child(Base): pass',
+             'class Grandchild(Child): pass']
+    lines += ['class Helper{}(object): pass'.format(i) for i in range(2000)]
+    lines += ['value_{} = {}'.format(i, i) for i in range(3000)]
+    lines += ['def function_{}(): pass'.format(i) for i in range(1000)]
+    module = ModuleType(name)
+    exec('\n'.join(lines), module.__dict__)
+    return module
+
+
+def _scan(module, parent_class, derives=is_non_strict_subclass):
+    """
+    Find the classes of a module which derive from a parent class (the scan of the module manager)
+    :param module: module
+    :param parent_class: class that should be inherited
+    :param derives: subclass check
+    :return: list of class names
+    """
+    return [cls.__name__ for cls in module.__dict__.values() if isinstance(cls, type) and derives(cls, parent_class)]
+
+
+def _walk_mro(cls, parent_class):
+    """
+    Subclass check by qualified names without the cache of the resolved hierarchies
+    """
+    return parent_class.__qualname__ in frozenset(base.__qualname__ for base in cls.__mro__)
+
+
+def test_scan_of_module_with_thousands_of_globals(measure):
+    module = _plugin_module('mro_scan_plugin')
+    assert sorted(_scan(module, BaseViewModel)) == ['Base', 'BaseViewModel', 'Child', 'Grandchild']
+
+    strict, uncached, by_name = measure(lambda: _scan(module, BaseViewModel, issubclass),
+                                       lambda: _scan(module, BaseViewModel, _walk_mro),
+                                       lambda: _scan(module, BaseViewModel), number=20)
+    assert by_name < uncached * 0.8     # the hierarchy of every class is resolved once and then looked up
+    assert by_name < strict * 6     # and stays in the order of the builtin check
+
+
+def test_scan_recognizes_reloaded_classes():
+    old_module = _plugin_module('mro_scan_plugin')
+    new_module = _plugin_module('mro_scan_plugin')  # reloaded module -> new class objects with the same names
+    assert new_module.Grandchild is not old_module.Grandchild
+    assert sorted(_scan(new_module, old_module.Base)) == ['Base', 'Child', 'Grandchild']
+    assert not is_non_strict_subclass(new_module.Helper0, old_module.Base)
@@ -0,0 +1,129 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from QtModularUiPack.ViewModels import BaseViewModel
+from PyQt5.QtCore import QCoreApplication
+from threading import Thread, Event, Barrier, get_ident
+from time import perf_counter
+
+
+WORKERS = 4
+
+
+def _pump_until(condition, timeout=30.0):
+    """
+    Process Qt events on the calling (GUI) thread until the condition is met
+    :param condition: function returning true when done
+    :param timeout: maximum time in seconds
+    :return: true if the condition was met
+    """
+    deadline = perf_counter() + timeout
+    while not condition():
+        if perf_counter() > deadline:
+            return False
+        QCoreApplication.processEvents()
+    return True
+
+
+def _record(view_model, gui_thread):
+    """
+    Connect a listener which records the notified names and the threads it was called on
+    :param view_model: view model to listen to
+    :param gui_thread: id of the GUI thread
+    :return: notified names, ids of other threads a notification arrived on
+    """
+    names, foreign_threads = list(), list()
+
+    def on_change(name):
+        if get_ident() != gui_thread:
+            foreign_threads.append(get_ident())
+        names.append(name)
+    view_model.property_changed.connect(on_change)
+    view_model.connect_property('value_0', on_change)
+    return names, foreign_threads
+
+
+def test_notifications_of_workers_are_delivered_on_gui_thread(app):
+    view_model = BaseViewModel()
+    names, foreign_threads = _record(view_model, get_ident())
+    barrier = Barrier(WORKERS)
+
+    def work(number):
+        barrier.wait()
+        for i in range(200):
+            view_model.notify_change('value_{}'.format(number))
+            with view_model.defer_notifications():
+                view_model.notify_change('deferred_{}'.format(number))
+                with view_model.defer_notifications():
+                    view_model.notify_change('deferred_{}'.format(number))
+
+    threads = [Thread(target=work, args=(i,), daemon=True) for i in range(WORKERS)]
+    for thread in threads:
+        thread.start()
+    expected = {'value_{}'.format(i) for i in range(WORKERS)} | {'deferred_{}'.format(i) for i in range(WORKERS)}
+    assert _pump_until(lambda: all(not t.is_alive() for t in threads) and expected <= set(names))
+    QCoreApplication.processEvents()
+
+    assert foreign_threads == []
+    assert view_model._held_changes == {} and view_model._deferred_depths == {}
+
+
+def test_worker_defer_block_does_not_hold_back_gui_notifications(app):
+    view_model = BaseViewModel()
+    names, foreign_threads = _record(view_model, get_ident())
+    entered, leave = Event(), Event()
+
+    def work():
+        with view_model.defer_notifications():
+            view_model.notify_change('worker')
+            entered.set()
+            leave.wait()
+
+    thread = Thread(target=work, daemon=True)
+    thread.start()
+    try:
+        assert entered.wait(10)
+        view_model.notify_change('gui')
+        assert names == ['gui']     # sent right away although the worker is inside a defer block
+
+        with view_model.defer_notifications():
+            view_model.notify_change('gui_deferred')
+            leave.set()
+            thread.join(10)
+            QCoreApplication.processEvents()    # the worker's flush arrives while the block is open
+            assert names == ['gui']
+        assert names == ['gui', 'gui_deferred', 'worker']   # held back together and sent once the block was left
+        assert foreign_threads == []
+    finally:
+        leave.set()     # never leave the worker waiting
+
+
+def test_worker_flush_while_gui_notification_is_pending(app):
+    view_model = BaseViewModel()
+    view_model.coalesce_notifications = True
+    names, foreign_threads = _record(view_model, get_ident())
+    view_model.notify_change('gui')     # pending until the event loop runs
+
+    def work():
+        with view_model.defer_notifications():
+            view_model.notify_change('worker')
+
+    thread = Thread(target=work, daemon=True)
+    thread.start()
+    thread.join(10)
+    assert names == []
+    assert _pump_until(lambda: {'gui', 'worker'} <= set(names))
+    assert foreign_threads == []
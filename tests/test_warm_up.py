@@ -0,0 +1,86 @@
+"""
+Copyright 2019 Dominik Werner
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import subprocess
+import sys
+
+
+PLUGINS = 200
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# loads all plugins of a folder in a fresh interpreter and prints the number of classes and the import time
+_START_UP = '''
+import sys
+from time import perf_counter
+from QtModularUiPack.Framework import ModuleManager
+from QtModularUiPack.ViewModels import BaseViewModel
+folder, warm_up = sys.argv[1], sys.argv[2] == 'warm'
+manager = ModuleManager.instance
+manager.use_discovery_cache = False
+if warm_up:
+    manager.warm_up([folder], workers=1).wait_compiled()    # the main window comes up in the meantime
+start = perf_counter()
+types = manager.load_classes_from_folder_derived_from(folder, BaseViewModel)
+duration = perf_counter() - start
+print(len([cls for cls in types if cls.__name__.startswith('StartupPlugin')]), duration)
+'''
+
+
+def _write_plugins(folder):
+    """
+    Write plugin modules with some code each (compiling them is a noticeable part of the first import)
+    :param folder: plugin folder
+    """
+    helpers = ''.join('def helper_{0}(x, y=2):\n'
+                      '    total = 0\n'
+                      '    for k in range(x):\n'
+                      '        total += k * y if k % 3 == 0 else -1\n'
+                      '    return [total, {{"k": x}}, (y, x)]\n'.format(i) for i in range(60))
+    for i in range(PLUGINS):
+        with open(os.path.join(folder, 'startup_plugin_{}.py'.format(i)), 'w') as file:
+            file.write('from QtModularUiPack.ViewModels import BaseViewModel\n')
+            file.write(helpers)
+            file.write('class StartupPlugin{0}(BaseViewModel):\n    name = "plugin {0}"\n'.format(i))
+
+
+def _start_up(folder, mode):
+    """
+    Load the plugins in a new interpreter
+    :param folder: plugin folder
+    :param mode: "cold" or "warm"
+    :return: number of loaded classes, import time in seconds
+    """
+    environment = dict(os.environ, PYTHONPATH=ROOT, QT_QPA_PLATFORM='offscreen')
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    output = subprocess.run([sys.executable, '-c', _START_UP, folder, mode], env=environment, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True, timeout=300).stdout
+    count, duration = output.split()[-2:]
+    return int(count), float(duration)
+
+
+def test_cold_start_with_200_plugins_with_and_without_warm_up(tmp_path):
+    cold_folder, warm_folder = tmp_path / 'cold', tmp_path / 'warm'
+    for folder in (cold_folder, warm_folder):
+        folder.mkdir()
+        _write_plugins(str(folder))
+
+    cold_count, cold = _start_up(str(cold_folder), 'cold')
+    warm_count, warm = _start_up(str(warm_folder), 'warm')
+
+    assert cold_count == warm_count == PLUGINS
+    assert len(os.listdir(str(warm_folder / '__pycache__'))) == PLUGINS
+    assert warm < cold * 0.7    # after the warm-up the GUI thread only loads byte code